@@ -7,6 +7,9 @@ A tile-flipping memory game with boss battles and item collection
 import pygame
 import random
 import sys
+import numpy as np
+from collections import deque
+from itertools import islice
 from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
 
@@ -45,6 +48,11 @@ TOURIAN_YELLOW = (160, 140, 0)    # Darker yellow for Tourian
 WRECKED_SHIP_PURPLE = (80, 0, 80) # Darker purple for Wrecked Ship
 CERES_GRAY = (100, 100, 100)      # Darker gray for Ceres
 
+# Flood-fill neighbor offsets: cardinals first, then diagonals, so area
+# growth prefers well-connected shapes
+_NEIGHBOR_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0),
+                     (-1, -1), (1, -1), (-1, 1), (1, 1))
+
 class TileType(Enum):
     """Types of tiles in the game"""
     EMPTY = "empty"
@@ -74,57 +82,206 @@ class GameState(Enum):
     PLAYING = "playing"
     GAME_OVER = "game_over"
 
+# Display names for enemies, bosses, and items - built once at import so
+# get_display_name is a single dict lookup
+_DISPLAY_NAMES = {
+    # Bosses
+    "mother_brain_1": "Mother Brain",
+    "mother_brain_2": "Mother Brain Phase 2",
+    "ridley": "Ridley",
+    "kraid": "Kraid",
+    "phantoon": "Phantoon",
+    "draygon": "Draygon",
+    "bomb_torizo": "Bomb Torizo",
+    "gold_torizo": "Gold Torizo",
+    "spore_spawn": "Spore Spawn",
+    "crocomire": "Crocomire",
+    "botwoon": "Botwoon",
+    "ceres_station": "Ceres Station",
+    "samus_ship": "Samus' Ship",
+    "golden_four": "Golden Four",
+    # Enemies
+    "geemer": "Geemer",
+    "skree": "Skree",
+    "side_hopper": "Side Hopper",
+    "ciser": "Ciser",
+    "metroid": "Metroid",
+    # Items - Consumables
+    "missiles": "Missiles",
+    "supers": "Super Missiles",
+    "power_bombs": "Power Bombs",
+    "energy_tank": "Energy Tank",
+    # Items - Movement
+    "morph": "Morph Ball",
+    "bomb": "Bombs",
+    "hijump": "High Jump Boots",
+    "speed": "Speed Booster",
+    "spring": "Spring Ball",
+    "space": "Space Jump",
+    "screw": "Screw Attack",
+    # Items - Beams
+    "charge": "Charge Beam",
+    "spazer": "Spazer Beam",
+    "wave": "Wave Beam",
+    "ice": "Ice Beam",
+    "plasma": "Plasma Beam",
+    # Items - Utility
+    "grapple": "Grapple Beam",
+    "xray": "X-ray Scope",
+    # Items - Suits
+    "varia": "Varia Suit",
+    "gravity": "Gravity Suit"
+}
+
+# Boss health values (increased for better balance)
+_BOSS_HEALTH = {
+    "bomb_torizo": 800,
+    "spore_spawn": 1200,
+    "kraid": 3000,
+    "crocomire": 2000,
+    "phantoon": 3500,
+    "botwoon": 2500,
+    "draygon": 4000,
+    "gold_torizo": 3000,
+    "ridley": 6000,
+    "mother_brain_1": 8000,
+    "mother_brain_2": 4000,
+    "samus_ship": 0,  # Ship has no health - it's the starting point
+    "ceres_station": 1000,
+    "golden_four": 6000
+}
+
+# Enemy health values (minor enemies)
+_ENEMY_HEALTH = {
+    "geemer": 50,
+    "skree": 75,
+    "side_hopper": 100,
+    "ciser": 125,
+    "metroid": 300  # Tough enemy in Tourian
+}
+
+# Enemy damage values (minor enemies)
+_ENEMY_DAMAGE = {
+    "geemer": 3,
+    "skree": 4,
+    "side_hopper": 5,
+    "ciser": 6,
+    "metroid": 15  # Metroids hit hard!
+}
+
+# Score awarded per collected item
+_ITEM_SCORES = {
+    "missiles": 10, "supers": 20, "power_bombs": 30, "energy_tank": 50,
+    "morph": 100, "bomb": 100, "hijump": 150, "speed": 150,
+    "grapple": 200, "xray": 200, "spring": 150, "space": 200,
+    "screw": 250, "charge": 150, "spazer": 200, "wave": 200,
+    "ice": 200, "plasma": 250, "varia": 300, "gravity": 400
+}
+
+# Score awarded per boss defeat
+_BOSS_SCORES = {
+    "bomb_torizo": 500, "spore_spawn": 800, "kraid": 2000, "crocomire": 1200,
+    "phantoon": 1500, "botwoon": 1000, "draygon": 1800, "gold_torizo": 1600,
+    "ridley": 2500, "mother_brain_1": 5000, "mother_brain_2": 3000,
+    "samus_ship": 800, "golden_four": 4000
+}
+
+# Score awarded per minor enemy defeat
+_ENEMY_SCORES = {
+    "geemer": 25, "skree": 35, "side_hopper": 50, "ciser": 75, "metroid": 150
+}
+
+# Boss attack damage values
+_BOSS_DAMAGE = {
+    "bomb_torizo": 5,
+    "spore_spawn": 8,
+    "kraid": 15,
+    "crocomire": 10,
+    "phantoon": 12,
+    "botwoon": 6,
+    "draygon": 20,
+    "gold_torizo": 18,
+    "ridley": 25,
+    "mother_brain_1": 30,
+    "mother_brain_2": 20,
+    "samus_ship": 3,
+    "ceres_station": 4,
+    "golden_four": 35
+}
+
+# Flat player damage bonus granted by each offensive unique item
+_DAMAGE_BONUSES = (
+    ("charge", 20), ("ice", 20), ("spazer", 30), ("wave", 20),
+    ("plasma", 25), ("screw", 50), ("speed", 20), ("bomb", 50)
+)
+
+# Compact uint8 encoding for the area map (255 = unassigned)
+_AREA_CODES = {area: np.uint8(i) for i, area in enumerate(AreaType)}
+_AREA_BY_CODE = tuple(AreaType)
+_AREA_UNASSIGNED = 255
+
+# Area colors, shared by the grid covers and any UI accents
+_AREA_COLORS = {
+    AreaType.CRATERIA: CRATERIA_LIGHT_BLUE,
+    AreaType.BRINSTAR: BRINSTAR_GREEN,
+    AreaType.NORFAIR: NORFAIR_RED,
+    AreaType.MARIDIA: MARIDIA_BLUE,
+    AreaType.TOURIAN: TOURIAN_YELLOW,
+    AreaType.WRECKED_SHIP: WRECKED_SHIP_PURPLE,
+    AreaType.CERES: CERES_GRAY
+}
+
+# Fixed inventory layout: consumables carry counts, unique items are one
+# bit each in Game.acquired (packed in this order). Consumable-vs-unique is
+# decided by hashed membership ("item_id in self.consumables" /
+# "item_id in _UNIQUE_BITS"), never by inspecting stored value types.
+_CONSUMABLE_ITEMS = ("missiles", "supers", "power_bombs", "energy_tank")
+_UNIQUE_ITEMS = ("morph", "bomb", "hijump", "speed", "grapple", "xray",
+                 "spring", "space", "screw", "charge", "spazer", "wave",
+                 "ice", "plasma", "varia", "gravity")
+_UNIQUE_BITS = {name: 1 << i for i, name in enumerate(_UNIQUE_ITEMS)}
+
+# Pre-bound masks for the items tested in the per-attack hot path, so the
+# damage math is a register bit test instead of a dict lookup per check
+_MASK_ICE = _UNIQUE_BITS["ice"]
+_MASK_GRAPPLE = _UNIQUE_BITS["grapple"]
+_MASK_VARIA = _UNIQUE_BITS["varia"]
+_MASK_GRAVITY = _UNIQUE_BITS["gravity"]
+
+# Every string that can appear as Tile.item_id gets a small integer id
+# (0 = the empty string on blank tiles). The damage/score tables are also
+# materialized as tuples indexed by that id so the combat loops do a plain
+# index load instead of hashing a string key. Sprite tables stay keyed by
+# the string form: those lookups only happen at load, board-patch, or
+# batched-HUD time, and the keys are interned literals with cached hashes
+_ENTITY_NAMES = (("",) + tuple(_BOSS_DAMAGE) + tuple(_ENEMY_DAMAGE) +
+                 _CONSUMABLE_ITEMS + _UNIQUE_ITEMS)
+_ENTITY_IDS = {name: i for i, name in enumerate(_ENTITY_NAMES)}
+_BOSS_DAMAGE_ARR = tuple(_BOSS_DAMAGE.get(name, 10) for name in _ENTITY_NAMES)
+_ENEMY_DAMAGE_ARR = tuple(_ENEMY_DAMAGE.get(name, 3) for name in _ENTITY_NAMES)
+_BOSS_SCORES_ARR = tuple(_BOSS_SCORES.get(name, 1000) for name in _ENTITY_NAMES)
+_ENEMY_SCORES_ARR = tuple(_ENEMY_SCORES.get(name, 25) for name in _ENTITY_NAMES)
+_ITEM_SCORES_ARR = tuple(_ITEM_SCORES.get(name, 10) for name in _ENTITY_NAMES)
+_INVENTORY_ORDER = _CONSUMABLE_ITEMS + _UNIQUE_ITEMS
+
+# Bosses tracked for defeats (no ship or golden_four)
+_BOSS_LIST = (
+    "bomb_torizo", "spore_spawn", "kraid", "crocomire",
+    "phantoon", "botwoon", "draygon", "gold_torizo",
+    "ridley", "mother_brain_1", "ceres_station"
+)
+
+# Bosses shown in the top-right tracker (no ship, ceres_station, or
+# golden_four)
+_TRACKED_BOSSES = (
+    "bomb_torizo", "spore_spawn", "kraid", "crocomire",
+    "phantoon", "botwoon", "draygon", "gold_torizo",
+    "ridley", "mother_brain_1"
+)
+
 def get_display_name(entity_id: str) -> str:
     """Get a nice display name for enemies, bosses, and items (standalone function)"""
-    display_names = {
-        # Bosses
-        "mother_brain_1": "Mother Brain",
-        "mother_brain_2": "Mother Brain Phase 2",
-        "ridley": "Ridley",
-        "kraid": "Kraid",
-        "phantoon": "Phantoon",
-        "draygon": "Draygon",
-        "bomb_torizo": "Bomb Torizo",
-        "gold_torizo": "Gold Torizo",
-        "spore_spawn": "Spore Spawn",
-        "crocomire": "Crocomire",
-        "botwoon": "Botwoon",
-        "ceres_station": "Ceres Station",
-        "samus_ship": "Samus' Ship",
-        "golden_four": "Golden Four",
-        # Enemies
-        "geemer": "Geemer",
-        "skree": "Skree",
-        "side_hopper": "Side Hopper",
-        "ciser": "Ciser",
-        "metroid": "Metroid",
-        # Items - Consumables
-        "missiles": "Missiles",
-        "supers": "Super Missiles",
-        "power_bombs": "Power Bombs",
-        "energy_tank": "Energy Tank",
-        # Items - Movement
-        "morph": "Morph Ball",
-        "bomb": "Bombs",
-        "hijump": "High Jump Boots",
-        "speed": "Speed Booster",
-        "spring": "Spring Ball",
-        "space": "Space Jump",
-        "screw": "Screw Attack",
-        # Items - Beams
-        "charge": "Charge Beam",
-        "spazer": "Spazer Beam",
-        "wave": "Wave Beam",
-        "ice": "Ice Beam",
-        "plasma": "Plasma Beam",
-        # Items - Utility
-        "grapple": "Grapple Beam",
-        "xray": "X-ray Scope",
-        # Items - Suits
-        "varia": "Varia Suit",
-        "gravity": "Gravity Suit"
-    }
-    return display_names.get(entity_id, entity_id.replace("_", " ").title())
+    return _DISPLAY_NAMES.get(entity_id) or entity_id.replace("_", " ").title()
 
 class SoundManager:
     """Manages all game audio - music and sound effects"""
@@ -261,19 +418,60 @@ class SoundManager:
         pygame.mixer.music.stop()
         self.current_music = None
 
+# Tile types that fight back; membership test replaces the two-way
+# enum equality chain
+_COMBATANT_TYPES = frozenset({TileType.BOSS, TileType.ENEMY})
+
+# Sprite-sheet cell offsets (name, x, y), kept at module scope like the
+# other static tables
+_BOSS_SPRITE_MAPPINGS = (
+    ("bomb_torizo", 0, 0),
+    ("spore_spawn", 64, 0),
+    ("kraid", 128, 0),
+    ("crocomire", 192, 0),
+    ("phantoon", 256, 0),
+    ("botwoon", 320, 0),
+    ("draygon", 384, 0),
+    ("gold_torizo", 448, 0),
+    ("ridley", 512, 0),
+    ("mother_brain_1", 576, 0),
+    ("mother_brain_2", 640, 0),
+    ("samus_ship", 704, 0),
+    ("ceres_station", 768, 0),
+    ("golden_four", 832, 0),
+)
+_ITEM_SPRITE_MAPPINGS = (
+    ("missiles", 0, 16), ("supers", 32, 16), ("power_bombs", 64, 16),
+    ("energy_tank", 64, 0), ("morph", 0, 0), ("bomb", 32, 0),
+    ("hijump", 0, 32), ("speed", 32, 32), ("grapple", 64, 32),
+    ("xray", 96, 32), ("spring", 0, 48), ("space", 32, 48),
+    ("screw", 64, 48), ("charge", 96, 48), ("spazer", 0, 64),
+    ("wave", 32, 64), ("ice", 64, 64), ("plasma", 96, 64),
+    ("varia", 0, 80), ("gravity", 32, 80),
+)
+_ENEMY_SPRITE_NAMES = ("geemer", "skree", "side_hopper", "ciser", "metroid")
+
 class Tile:
     """Represents a single tile on the grid"""
+    __slots__ = ('x', 'y', 'tile_type', 'item_id', 'area', 'state',
+                 'health', 'max_health', 'frozen', 'item_idx')
+
     def __init__(self, x: int, y: int, tile_type: TileType, item_id: str = "", area: AreaType = None):
+        self.reinit(x, y, tile_type, item_id, area)
+
+    def reinit(self, x: int, y: int, tile_type: TileType, item_id: str = "", area: AreaType = None):
+        """Re-initialize a tile in place (lets pooled tiles be reused on reset)"""
         self.x = x
         self.y = y
         self.tile_type = tile_type
         self.item_id = item_id
+        self.item_idx = _ENTITY_IDS.get(item_id, 0)  # Integer form of item_id
         self.area = area
         self.state = TileState.FACE_DOWN
         self.health = 0  # For bosses
         self.max_health = 0  # For bosses
         self.frozen = False  # For ice beam freeze effect
-        
+
     def get_screen_position(self) -> Tuple[int, int]:
         """Get the screen position of this tile"""
         screen_x = GRID_START_X + self.x * TILE_SIZE
@@ -286,20 +484,75 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Super Metroid Memory Battle")
         self.clock = pygame.time.Clock()
+        self.grid_rect = pygame.Rect(GRID_START_X, GRID_START_Y,
+                                     GRID_SIZE * TILE_SIZE, GRID_SIZE * TILE_SIZE)
+
+        # Dirty-rect bookkeeping: most frames nothing on screen changes, so
+        # render() only pushes regions that did (or skips the present entirely)
+        self.log_rect = pygame.Rect(COMBAT_INFO_X, GRID_START_Y,
+                                    HUD_WIDTH, GRID_SIZE * TILE_SIZE)
+        self._dirty_rects = []
+        self._full_redraw = True
+        # Set when score/energy/inventory changed; render() swaps it for the
+        # tight rects the HUD draws return instead of the full-width strip
+        self._hud_dirty = False
+
+        # Console echo of the combat log; stdout writes can stall the main
+        # loop (especially on Windows consoles), so keep it off by default
+        self._debug_print = False
+
+        # Font construction is expensive; build each size once and reuse
+        self._font16 = pygame.font.Font(None, 16)
+        self._font20 = pygame.font.Font(None, 20)
+        self._font24 = pygame.font.Font(None, 24)
+        self._font32 = pygame.font.Font(None, 32)
+
+        # Rendered-text cache keyed by (font, text, color); log lines are
+        # immutable once appended so re-rasterizing them is pure waste
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+
+        # Batched uniform draws for per-frame combat rolls; refilled when
+        # exhausted so PRNG overhead is amortized across thousands of calls
+        self._rand_pool = np.random.random(4096)
+        self._rand_idx = 0
+
+        # HUD icon layouts never change; precompute (id, x, y) per slot so
+        # the draw loops do no per-frame coordinate arithmetic
+        per_row = len(_INVENTORY_ORDER) // 2
+        self._inv_slots = [
+            (item_id, 320 + (i % per_row) * 34, INVENTORY_Y + (i // per_row) * 35)
+            for i, item_id in enumerate(_INVENTORY_ORDER)
+        ]
+        # Per-slot dirty rects, padded to cover the count labels that hang
+        # past the 32px icons
+        self._inv_rects = [pygame.Rect(x, y, 40, 38) for _, x, y in self._inv_slots]
+        # Energy tanks plus remainder text all land left of the inventory bar
+        self._energy_rect = pygame.Rect(0, 0, 320, GRID_START_Y)
+        tracker_start_x = BOSS_HUD_X + (BOSS_HUD_WIDTH - (5 * 34 - 2))
+        self._boss_slots = [
+            (boss_id, tracker_start_x + (i % 5) * 34, INVENTORY_Y + (i // 5) * 34)
+            for i, boss_id in enumerate(_TRACKED_BOSSES)
+        ]
         self.running = True
         self.state = GameState.PLAYING
         self.game_over = False
         self.victory = False
         
         # Game grid
-        self.grid: List[List[Tile]] = []
-        self.inventory: Dict[str, int] = {}
-        self.revealed_tiles: List[Tuple[int, int]] = []  # Track revealed positions
+        # Flat row-major grid: tile at (x, y) lives at index y * GRID_SIZE + x
+        self.grid: List[Tile] = []
+        self.consumables: Dict[str, int] = {}
+        self.acquired: int = 0  # One bit per unique item (see _UNIQUE_BITS)
+        self._damage_bonus: int = 0  # Cached sum of beam/suit flat bonuses
+        self._attack_first_chance: float = 0.0  # Cached; see _recompute_derived
+        self.revealed_mask: int = 0  # Bit y*GRID_SIZE+x set when tile revealed
         
         # Combat system
         self.player_energy = 99  # Starting energy
         self.max_energy = 99
-        self.combat_log: List[str] = []
+        # maxlen drops the oldest line in O(1); a list.pop(0) cap would
+        # shift every remaining message on each append
+        self.combat_log: deque = deque(maxlen=28)
         self.boss_turn_timer = 0
         self.boss_turn_interval = 60  # Frames between boss attacks (1 second at 60fps)
         self.player_attack_timer = 0
@@ -310,8 +563,47 @@ class Game:
         self.score = 0
         self.boss_defeats = {}  # Track boss defeats
         
+        # Pre-rendered tile covers/backgrounds so the board cache is built
+        # from blits instead of per-tile rect fills
+        self._area_covers = {area: self._make_tile_cover(color)
+                             for area, color in _AREA_COLORS.items()}
+        self._hidden_cover = self._make_tile_cover(DARK_TAN)
+        self._revealed_bg = self._make_tile_cover(BLACK)
+
+        # Layout snapshots keyed by seed: replay/benchmark runs with a fixed
+        # seed skip the flood-fill and placement work entirely
+        self._layout_cache: Dict[int, tuple] = {}
+
+        # Fixed pool of tiles, re-initialized in place on every reset so a
+        # new game doesn't churn 100 allocations through the GC
+        self.tile_pool = [Tile(idx % GRID_SIZE, idx // GRID_SIZE, TileType.EMPTY)
+                          for idx in range(GRID_SIZE * GRID_SIZE)]
+
         # Initialize sprite system
         self.sprite_manager = SpriteManager()
+
+        # The inventory layout is fixed, so partial-evaluate it: fetch the
+        # 32px icon surfaces once and generate one straight-line function of
+        # bitmask-gated blits (bit i = slot i owned; see _inventory_bits)
+        self._inv_icons = [self.sprite_manager.get_item(item_id, 32)
+                           for item_id, _, _ in self._inv_slots]
+        self._inv_icons_gray = [self.sprite_manager.get_item(item_id, 32, gray=True)
+                                for item_id, _, _ in self._inv_slots]
+        lines = ["def _draw_inv_icons(screen, bits, owned, gray):"]
+        for i, (_, x, y) in enumerate(self._inv_slots):
+            # Slots whose sprite failed to load never get a blit line,
+            # matching the None tolerance of the other draw paths
+            if self._inv_icons[i] is None or self._inv_icons_gray[i] is None:
+                continue
+            lines.append(f"    screen.blit((owned if bits & {1 << i} else gray)"
+                         f"[{i}], ({x}, {y}))")
+        if len(lines) == 1:  # no sprites at all (headless/missing sheet)
+            lines.append("    pass")
+        namespace = {}
+        exec(compile("\n".join(lines), "<inventory_hud>", "exec"), namespace)
+        self._draw_inv_icons = namespace["_draw_inv_icons"]
+        self._consumable_slots = [(item_id, x, y) for item_id, x, y in self._inv_slots
+                                  if item_id in _CONSUMABLE_ITEMS]
         
         # Initialize sound system
         self.sound_manager = SoundManager()
@@ -321,45 +613,49 @@ class Game:
         # Initialize game
         self.initialize_game()
         
-    def initialize_game(self):
-        """Initialize the game grid and inventory"""
+    def initialize_game(self, seed: int = None):
+        """Initialize the game grid and inventory
+
+        With a seed, the generated layout is cached and replayed on later
+        resets with the same seed (useful for replays and benchmarks).
+        """
         # Create empty grid
-        self.grid = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        
-        # Initialize inventory - consumables have counts, others are boolean
-        self.inventory = {
-            "missiles": 0,      # Consumable
-            "supers": 0,        # Consumable  
-            "power_bombs": 0,   # Consumable
-            "energy_tank": 0,   # Consumable
-            "morph": False,     # Unique item
-            "bomb": False,      # Unique item
-            "hijump": False,    # Unique item
-            "speed": False,     # Unique item
-            "grapple": False,   # Unique item
-            "xray": False,      # Unique item
-            "spring": False,    # Unique item
-            "space": False,     # Unique item
-            "screw": False,     # Unique item
-            "charge": False,    # Unique item (beam)
-            "spazer": False,    # Unique item (beam)
-            "wave": False,      # Unique item (beam)
-            "ice": False,       # Unique item (beam)
-            "plasma": False,    # Unique item (beam)
-            "varia": False,     # Unique item (suit)
-            "gravity": False,   # Unique item (suit)
-        }
+        self.grid = [None] * (GRID_SIZE * GRID_SIZE)
+
+        # Face-up, still-alive bosses/enemies; lets is_fight_active avoid
+        # scanning the grid every call
+        self.active_fight_count = 0
+
+        # Live combatant tiles - the per-frame combat loops iterate these
+        # instead of scanning all GRID_SIZE * GRID_SIZE tiles
+        self.active_bosses: List[Tile] = []
+        self.active_enemies: List[Tile] = []
+
+        # Direct item_id -> Tile references for placed bosses (O(1) lookups
+        # like the Ceres Station -> Ridley interaction)
+        self._boss_refs: Dict[str, Tile] = {}
+        
+        # Initialize inventory - consumable counts plus the unique-item bitmask
+        self.consumables = dict.fromkeys(_CONSUMABLE_ITEMS, 0)
+        self.acquired = 0
+        self._recompute_derived()
         
         # Initialize boss defeats tracking (no ship or golden_four)
-        boss_list = [
-            "bomb_torizo", "spore_spawn", "kraid", "crocomire",
-            "phantoon", "botwoon", "draygon", "gold_torizo",
-            "ridley", "mother_brain_1", "ceres_station"
-        ]
-        self.boss_defeats = {boss: 0 for boss in boss_list}
+        self.boss_defeats = dict.fromkeys(_BOSS_LIST, 0)
         
-        # Populate grid with random tiles
-        self.populate_grid()
+        # Populate grid with random tiles (or replay a cached layout)
+        cached = self._layout_cache.get(seed) if seed is not None else None
+        if cached is not None:
+            self._restore_layout(cached)
+        else:
+            if seed is not None:
+                random.seed(seed)
+            self.populate_grid()
+            if seed is not None:
+                self._layout_cache[seed] = self._capture_layout()
+
+        # Pre-render the static board art once; draw_grid just blits it
+        self.build_board_surface()
         
     def populate_grid(self):
         """Fill the grid with themed areas like Super Metroid"""
@@ -416,48 +712,17 @@ class Game:
             }
         }
         
-        # Boss health values (increased for better balance)
-        boss_health = {
-            "bomb_torizo": 800,
-            "spore_spawn": 1200,
-            "kraid": 3000,
-            "crocomire": 2000,
-            "phantoon": 3500,
-            "botwoon": 2500,
-            "draygon": 4000,
-            "gold_torizo": 3000,
-            "ridley": 6000,
-            "mother_brain_1": 8000,
-            "mother_brain_2": 4000,
-            "samus_ship": 0,  # Ship has no health - it's the starting point
-            "ceres_station": 1000,
-            "golden_four": 6000
-        }
-        
-        # Enemy health values (minor enemies)
-        enemy_health = {
-            "geemer": 50,
-            "skree": 75,
-            "side_hopper": 100,
-            "ciser": 125,
-            "metroid": 300  # Tough enemy in Tourian
-        }
-        
-        # Enemy damage values (minor enemies)
-        self.enemy_damage = {
-            "geemer": 3,
-            "skree": 4,
-            "side_hopper": 5,
-            "ciser": 6,
-            "metroid": 15  # Metroids hit hard!
-        }
-        
-        # Create area map (hidden from player)
-        self.area_map = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        # Create area map (hidden from player) - flat uint8 codes so bulk
+        # queries ("all cells of area X") run as vectorized compares
+        self.area_map = np.full(GRID_SIZE * GRID_SIZE, _AREA_UNASSIGNED, dtype=np.uint8)
         
         # Step 1: Define all area types that MUST be placed
         all_area_types = list(areas.keys())
-        
+
+        # Unassigned flat indices, kept in sync by flood_fill_area so the
+        # fallback below never has to rescan the map
+        free_cells = set(range(GRID_SIZE * GRID_SIZE))
+
         # Step 2: Place each area type with guaranteed minimum size and connectivity
         for area_type in all_area_types:
             # Find a suitable starting position
@@ -478,20 +743,15 @@ class Game:
                     start_x, start_y = random.randint(1, 8), random.randint(1, 8)
                 
                 # Check if this position is available
-                if self.area_map[start_y][start_x] is None:
+                if self.area_map[start_y * GRID_SIZE + start_x] == _AREA_UNASSIGNED:
                     break
                 attempts += 1
             
-            # If we couldn't find a spot, pick the first available None
-            if attempts >= 50:
-                for y in range(GRID_SIZE):
-                    for x in range(GRID_SIZE):
-                        if self.area_map[y][x] is None:
-                            start_x, start_y = x, y
-                            break
-                    else:
-                        continue
-                    break
+            # If we couldn't find a spot, pick any still-free cell (if the
+            # map is already full the flood fill below is a no-op anyway)
+            if attempts >= 50 and free_cells:
+                idx = next(iter(free_cells))
+                start_x, start_y = idx % GRID_SIZE, idx // GRID_SIZE
             
             # Determine area size based on type
             if area_type == AreaType.WRECKED_SHIP:
@@ -502,119 +762,171 @@ class Game:
                 area_size = random.randint(12, 25)  # Larger areas
             
             # Create the connected area
-            self.flood_fill_area(start_x, start_y, area_type, area_size)
-        
-        # Step 3: Fill any remaining None areas with Crateria (default)
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                if self.area_map[y][x] is None:
-                    self.area_map[y][x] = AreaType.CRATERIA
-        
+            self.flood_fill_area(start_x, start_y, area_type, area_size, free_cells)
+
+        # Step 3: Fill any remaining unassigned cells with Crateria (default)
+        if free_cells:
+            self.area_map[list(free_cells)] = _AREA_CODES[AreaType.CRATERIA]
+
+        # Build per-area cell lists once so the placement steps below never
+        # have to rescan the whole grid per boss/item
+        self.area_cells = {}
+        for area_type in areas:
+            idxs = np.nonzero(self.area_map == _AREA_CODES[area_type])[0]
+            self.area_cells[area_type] = [(int(i) % GRID_SIZE, int(i) // GRID_SIZE)
+                                          for i in idxs]
+
         # Step 4: Place bosses within their appropriate areas
         self.boss_placements = {}
         for area_type, area_data in areas.items():
             for boss_id in area_data["bosses"]:
-                # Find suitable position within the area
+                area_tiles = self.area_cells[area_type]
+
+                # Find suitable positions within the area
                 suitable_positions = []
-                for y in range(GRID_SIZE):
-                    for x in range(GRID_SIZE):
-                        if self.area_map[y][x] == area_type:
-                            # Check minimum distance from other bosses (except ship)
-                            too_close = False
-                            if boss_id != "samus_ship":
-                                for (bx, by), _ in self.boss_placements.items():
-                                    if abs(x - bx) + abs(y - by) < 3:
-                                        too_close = True
-                                        break
-                            
-                            if not too_close:
-                                suitable_positions.append((x, y))
-                
+                for x, y in area_tiles:
+                    # Check minimum distance from other bosses (except ship)
+                    too_close = False
+                    if boss_id != "samus_ship":
+                        for bx, by in self.boss_placements:
+                            if abs(x - bx) + abs(y - by) < 3:
+                                too_close = True
+                                break
+
+                    if not too_close:
+                        suitable_positions.append((x, y))
+
                 # Place boss if suitable position found
                 if suitable_positions:
                     x, y = random.choice(suitable_positions)
                     self.boss_placements[(x, y)] = (boss_id, area_type)
+                elif area_tiles:
+                    # No suitable position - place anyway (relaxed placement for small areas)
+                    x, y = random.choice(area_tiles)
+                    self.boss_placements[(x, y)] = (boss_id, area_type)
+                    print(f"Warning: {get_display_name(boss_id)} placed in small area without distance check")
                 else:
-                    # If no suitable position found, place anyway (relaxed placement for small areas)
-                    fallback_positions = []
-                    for y in range(GRID_SIZE):
-                        for x in range(GRID_SIZE):
-                            if self.area_map[y][x] == area_type:
-                                fallback_positions.append((x, y))
-                    
-                    if fallback_positions:
-                        x, y = random.choice(fallback_positions)
-                        self.boss_placements[(x, y)] = (boss_id, area_type)
-                        print(f"Warning: {get_display_name(boss_id)} placed in small area without distance check")
-                    else:
-                        print(f"ERROR: Could not place {get_display_name(boss_id)} - no tiles in {area_type}")
+                    print(f"ERROR: Could not place {get_display_name(boss_id)} - no tiles in {area_type}")
         
         # Step 5: Place unique items, consumables, and enemies in correct areas
-        self.place_items_in_areas(areas, boss_health, enemy_health)
-        
-    def flood_fill_area(self, start_x: int, start_y: int, area_type: AreaType, max_tiles: int):
+        self.place_items_in_areas(areas)
+
+    def _capture_layout(self) -> tuple:
+        """Snapshot the generated layout as plain tuples for the seed cache"""
+        tiles = tuple((tile.x, tile.y, tile.tile_type, tile.item_id,
+                       tile.area, tile.max_health) for tile in self.grid)
+        return (self.area_map.copy(), dict(self.boss_placements), tiles)
+
+    def _restore_layout(self, cached: tuple):
+        """Re-materialize a cached layout into the tile pool, skipping generation"""
+        area_map, boss_placements, tiles = cached
+        self.area_map = area_map.copy()
+        self.boss_placements = dict(boss_placements)
+
+        self.area_cells = {area: [] for area in AreaType}
+        for idx, code in enumerate(self.area_map):
+            y, x = divmod(idx, GRID_SIZE)
+            self.area_cells[_AREA_BY_CODE[code]].append((x, y))
+
+        for x, y, tile_type, item_id, area, max_health in tiles:
+            tile = self.make_tile(x, y, tile_type, item_id, area)
+            tile.health = max_health
+            tile.max_health = max_health
+            self.grid[y * GRID_SIZE + x] = tile
+            if tile_type == TileType.BOSS:
+                self._boss_refs[item_id] = tile
+
+        # Replay the ship arrival (normally done during placement)
+        for (x, y), (boss_id, area_type) in self.boss_placements.items():
+            if boss_id == "samus_ship":
+                tile = self.grid[y * GRID_SIZE + x]
+                tile.state = TileState.FACE_UP
+                self.revealed_mask |= 1 << (y * GRID_SIZE + x)
+                self.log_combat("You've arrived at Zebes.")
+                self.log_combat("destroy Mother Brain to save Samus.")
+                use_rainstorm = (area_type == AreaType.CRATERIA)
+                self.sound_manager.play_area_music(area_type, False, use_rainstorm)
+                self.last_clicked_area = area_type
+                self.tiles_clicked = 1  # Count the ship tile as first click
+
+    def make_tile(self, x: int, y: int, tile_type: TileType, item_id: str = "", area: AreaType = None) -> Tile:
+        """Re-initialize the pooled tile for (x, y) instead of allocating a new one"""
+        tile = self.tile_pool[y * GRID_SIZE + x]
+        tile.reinit(x, y, tile_type, item_id, area)
+        return tile
+
+    def flood_fill_area(self, start_x: int, start_y: int, area_type: AreaType,
+                        max_tiles: int, free_cells: set):
         """Flood fill to create connected area with better connectivity"""
-        if self.area_map[start_y][start_x] is not None:
+        area_map = self.area_map
+        GS = GRID_SIZE
+        code = _AREA_CODES[area_type]
+
+        if area_map[start_y * GS + start_x] != _AREA_UNASSIGNED:
             return
-            
+
         # Use a more sophisticated flood fill that prioritizes connectivity
-        stack = [(start_x, start_y)]
+        stack = deque([(start_x, start_y)])
         placed = 0
         visited = set()
-        
+
         while stack and placed < max_tiles:
-            x, y = stack.pop(0)
-            
+            x, y = stack.popleft()
+
             # Skip if already visited or out of bounds
-            if (x, y) in visited or not (0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE):
+            if (x, y) in visited or not (0 <= x < GS and 0 <= y < GS):
                 continue
-                
+
             # Skip if already assigned
-            if self.area_map[y][x] is not None:
+            if area_map[y * GS + x] != _AREA_UNASSIGNED:
                 continue
-                
-            self.area_map[y][x] = area_type
+
+            area_map[y * GS + x] = code
+            free_cells.discard(y * GS + x)
             placed += 1
             visited.add((x, y))
-            
-            # Add neighbors with priority: cardinals first, then diagonals
-            # This ensures better connectivity
-            neighbors = [
-                (x, y-1), (x, y+1), (x-1, y), (x+1, y),  # Cardinals first
-                (x-1, y-1), (x+1, y-1), (x-1, y+1), (x+1, y+1)  # Diagonals second
-            ]
-            
-            for nx, ny in neighbors:
-                if ((nx, ny) not in visited and 
-                    0 <= nx < GRID_SIZE and 0 <= ny < GRID_SIZE and 
-                    self.area_map[ny][nx] is None):
+
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if ((nx, ny) not in visited and
+                    0 <= nx < GS and 0 <= ny < GS and
+                    area_map[ny * GS + nx] == _AREA_UNASSIGNED):
                     stack.append((nx, ny))
                     
     def find_nearest_area(self, x: int, y: int) -> AreaType:
-        """Find the nearest area type"""
-        min_dist = float('inf')
-        nearest = None
-        
-        for ay in range(GRID_SIZE):
-            for ax in range(GRID_SIZE):
-                if self.area_map[ay][ax] is not None:
-                    dist = abs(x - ax) + abs(y - ay)
-                    if dist < min_dist:
-                        min_dist = dist
-                        nearest = self.area_map[ay][ax]
-                        
-        return nearest
-        
-    def place_items_in_areas(self, areas: dict, boss_health: dict, enemy_health: dict):
+        """Find the nearest area type (BFS out from the query cell)"""
+        area_map = self.area_map
+        GS = GRID_SIZE
+
+        # Areas are dense, so the BFS almost always terminates within the
+        # first ring of neighbors instead of scanning the whole map
+        queue = deque([(x, y)])
+        visited = {(x, y)}
+
+        while queue:
+            cx, cy = queue.popleft()
+            code = area_map[cy * GS + cx]
+            if code != _AREA_UNASSIGNED:
+                return _AREA_BY_CODE[code]
+
+            for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+                nx, ny = cx + dx, cy + dy
+                if (nx, ny) not in visited and 0 <= nx < GS and 0 <= ny < GS:
+                    visited.add((nx, ny))
+                    queue.append((nx, ny))
+
+        return None
+        
+    def place_items_in_areas(self, areas: dict):
         """Place items, bosses, and enemies in their correct areas"""
         # First place bosses
         for (x, y), (boss_id, area_type) in self.boss_placements.items():
             if boss_id == "samus_ship":
-                tile = Tile(x, y, TileType.BOSS, boss_id, area_type)
+                tile = self.make_tile(x, y, TileType.BOSS, boss_id, area_type)
                 tile.state = TileState.FACE_UP
                 tile.health = 0
                 tile.max_health = 0
-                self.revealed_tiles.append((x, y))
+                self.revealed_mask |= 1 << (y * GRID_SIZE + x)
                 self.log_combat("You've arrived at Zebes.")
                 self.log_combat("destroy Mother Brain to save Samus.")
                 # Start with rainstorm music for Crateria (ship location is always first tile)
@@ -623,49 +935,48 @@ class Game:
                 self.last_clicked_area = area_type
                 self.tiles_clicked = 1  # Count the ship tile as first click
             else:
-                tile = Tile(x, y, TileType.BOSS, boss_id, area_type)
-                tile.health = boss_health[boss_id]
-                tile.max_health = boss_health[boss_id]
-            self.grid[y][x] = tile
+                tile = self.make_tile(x, y, TileType.BOSS, boss_id, area_type)
+                tile.health = _BOSS_HEALTH[boss_id]
+                tile.max_health = _BOSS_HEALTH[boss_id]
+            self.grid[y * GRID_SIZE + x] = tile
+            self._boss_refs[boss_id] = tile
             
         # Then place unique items (one per area)
         for area_type, area_data in areas.items():
             unique_items = area_data["unique_items"].copy()
             random.shuffle(unique_items)
             
-            area_tiles = []
-            for y in range(GRID_SIZE):
-                for x in range(GRID_SIZE):
-                    if self.area_map[y][x] == area_type and self.grid[y][x] is None:
-                        area_tiles.append((x, y))
+            area_tiles = [(x, y) for x, y in self.area_cells[area_type]
+                          if self.grid[y * GRID_SIZE + x] is None]
             
             # Place one of each unique item
             for i, item_id in enumerate(unique_items):
                 if i < len(area_tiles):
                     x, y = area_tiles[i]
-                    tile = Tile(x, y, TileType.ITEM, item_id, area_type)
-                    self.grid[y][x] = tile
+                    tile = self.make_tile(x, y, TileType.ITEM, item_id, area_type)
+                    self.grid[y * GRID_SIZE + x] = tile
                     
         # Fill remaining tiles with consumables, enemies, or empty
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                if self.grid[y][x] is None:
-                    area_type = self.area_map[y][x]
-                    area_data = areas[area_type]
-                    
-                    rand = random.random()
-                    if rand < 0.27:  # % chance for consumable
-                        item_id = random.choice(area_data["consumables"])
-                        tile = Tile(x, y, TileType.ITEM, item_id, area_type)
-                    elif rand < 0.40:  # % chance for enemy
-                        enemy_id = random.choice(area_data["enemies"])
-                        tile = Tile(x, y, TileType.ENEMY, enemy_id, area_type)
-                        tile.health = enemy_health[enemy_id]
-                        tile.max_health = enemy_health[enemy_id]
-                    else:  # 60% empty
-                        tile = Tile(x, y, TileType.EMPTY, "", area_type)
-                    
-                    self.grid[y][x] = tile
+        # (linear pass over the flat grid; same row-major order as before)
+        for idx in range(GRID_SIZE * GRID_SIZE):
+            if self.grid[idx] is None:
+                y, x = divmod(idx, GRID_SIZE)
+                area_type = _AREA_BY_CODE[self.area_map[idx]]
+                area_data = areas[area_type]
+                
+                rand = random.random()
+                if rand < 0.27:  # % chance for consumable
+                    item_id = random.choice(area_data["consumables"])
+                    tile = self.make_tile(x, y, TileType.ITEM, item_id, area_type)
+                elif rand < 0.40:  # % chance for enemy
+                    enemy_id = random.choice(area_data["enemies"])
+                    tile = self.make_tile(x, y, TileType.ENEMY, enemy_id, area_type)
+                    tile.health = _ENEMY_HEALTH[enemy_id]
+                    tile.max_health = _ENEMY_HEALTH[enemy_id]
+                else:  # 60% empty
+                    tile = self.make_tile(x, y, TileType.EMPTY, "", area_type)
+                
+                self.grid[idx] = tile
                 
                     
     def handle_events(self):
@@ -680,7 +991,7 @@ class Game:
                 if event.button == 1:  # Left click
                     self.handle_click(event.pos)
                     
-    def reset_game(self):
+    def reset_game(self, seed: int = None):
         """Reset the game to initial state - complete new game"""
         # Reset game state
         self.game_over = False
@@ -692,42 +1003,17 @@ class Game:
         self.max_energy = 99
         
         # Clear combat log
-        self.combat_log = []
+        self.combat_log.clear()
         
         # Reset boss defeats
-        boss_list = [
-            "bomb_torizo", "spore_spawn", "kraid", "crocomire",
-            "phantoon", "botwoon", "draygon", "gold_torizo",
-            "ridley", "mother_brain_1", "ceres_station"
-        ]
-        self.boss_defeats = {boss: 0 for boss in boss_list}
+        self.boss_defeats = dict.fromkeys(_BOSS_LIST, 0)
         
         # Reset inventory
-        self.inventory = {
-            "missiles": 0,      # Consumable
-            "supers": 0,        # Consumable  
-            "power_bombs": 0,   # Consumable
-            "energy_tank": 0,   # Consumable
-            "morph": False,     # Unique item
-            "bomb": False,      # Unique item
-            "hijump": False,    # Unique item
-            "speed": False,     # Unique item
-            "grapple": False,   # Unique item
-            "xray": False,      # Unique item
-            "spring": False,    # Unique item
-            "space": False,     # Unique item
-            "screw": False,     # Unique item
-            "charge": False,    # Unique item (beam)
-            "spazer": False,    # Unique item (beam)
-            "wave": False,      # Unique item (beam)
-            "ice": False,       # Unique item (beam)
-            "plasma": False,    # Unique item (beam)
-            "varia": False,     # Unique item (suit)
-            "gravity": False,   # Unique item (suit)
-        }
+        self.consumables = dict.fromkeys(_CONSUMABLE_ITEMS, 0)
+        self.acquired = 0
         
         # Clear revealed tiles
-        self.revealed_tiles = []
+        self.revealed_mask = 0
         
         # Reset combat timers
         self.boss_turn_timer = 0
@@ -737,22 +1023,16 @@ class Game:
         self.tiles_clicked = 0
         self.last_clicked_area = None
         
-        # Regenerate the ENTIRE grid with new random layout
-        self.initialize_game()
+        # Regenerate the ENTIRE grid (seeded resets replay a cached layout)
+        self.initialize_game(seed)
+        self._full_redraw = True
         
         # Log reset message
         self.log_combat("New game started! Press R to reset again.")
                     
     def is_fight_active(self) -> bool:
         """Check if any boss or enemy is currently active (face-up and alive)"""
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                tile = self.grid[y][x]
-                if ((tile.tile_type == TileType.BOSS or tile.tile_type == TileType.ENEMY) and 
-                    tile.state == TileState.FACE_UP and 
-                    tile.health > 0):
-                    return True
-        return False
+        return self.active_fight_count > 0
                     
     def handle_click(self, pos: Tuple[int, int]):
         """Handle mouse click on grid"""
@@ -761,16 +1041,16 @@ class Game:
             return
             
         x, y = pos
-        
-        # Check if click is within grid bounds
-        if (GRID_START_X <= x < GRID_START_X + GRID_SIZE * TILE_SIZE and
-            GRID_START_Y <= y < GRID_START_Y + GRID_SIZE * TILE_SIZE):
-            
+
+        # Check if click is within grid bounds (Rect.collidepoint runs in C)
+        if self.grid_rect.collidepoint(x, y):
+            TS = TILE_SIZE
+
             # Convert to grid coordinates
-            grid_x = (x - GRID_START_X) // TILE_SIZE
-            grid_y = (y - GRID_START_Y) // TILE_SIZE
+            grid_x = (x - GRID_START_X) // TS
+            grid_y = (y - GRID_START_Y) // TS
             
-            tile = self.grid[grid_y][grid_x]
+            tile = self.grid[grid_y * GRID_SIZE + grid_x]
             
             # Only interact with tiles that are still hidden or previewed
             if tile.state not in (TileState.FACE_DOWN, TileState.PREVIEWED):
@@ -779,13 +1059,15 @@ class Game:
             if not self.can_click_tile(grid_x, grid_y):
                 return
 
-            has_gravity = self.inventory.get("gravity", False)
+            has_gravity = self.has_item("gravity")
 
             # Special handling for Maridia without the Gravity Suit
             if tile.area == AreaType.MARIDIA and not has_gravity:
                 self.sound_manager.play_sound("ui_click")
                 if tile.state != TileState.PREVIEWED:
                     tile.state = TileState.PREVIEWED
+                    self.redraw_tile_cache(grid_x, grid_y)
+                    self._mark_tile_dirty(grid_x, grid_y)
                     area_name = self.get_area_display_name(tile.area)
                     self.log_combat(f"{area_name} resists entry without the Gravity Suit!")
                 else:
@@ -795,9 +1077,18 @@ class Game:
             # Normal reveal flow
             self.sound_manager.play_sound("ui_click")
             tile.state = TileState.FACE_UP
-            if (grid_x, grid_y) not in self.revealed_tiles:
-                self.revealed_tiles.append((grid_x, grid_y))
+            self.redraw_tile_cache(grid_x, grid_y)
+            self._mark_tile_dirty(grid_x, grid_y)
+            # Reveals can also touch score, energy, and the item HUD
+            self._hud_dirty = True
+            self.revealed_mask |= 1 << (grid_y * GRID_SIZE + grid_x)
             self.tiles_clicked += 1
+            if tile.tile_type in _COMBATANT_TYPES and tile.health > 0:
+                self.active_fight_count += 1
+                if tile.tile_type == TileType.BOSS:
+                    self.active_bosses.append(tile)
+                else:
+                    self.active_enemies.append(tile)
 
             # Check if we entered a new area and update music
             if tile.area != self.last_clicked_area and not self.is_fight_active():
@@ -815,39 +1106,34 @@ class Game:
             if tile.tile_type == TileType.ITEM:
                 display_name = self.get_display_name(tile.item_id)
                 # Check if item already collected (for unique items)
-                if isinstance(self.inventory[tile.item_id], bool):
-                    if self.inventory[tile.item_id]:
+                if tile.item_id in _UNIQUE_BITS:
+                    item_bit = _UNIQUE_BITS[tile.item_id]
+                    if self.acquired & item_bit:
                         self.log_combat(f"Already have {display_name}!")
                         return
                     else:
-                        self.inventory[tile.item_id] = True
+                        self.acquired |= item_bit
+                        self._recompute_derived()
                         self.log_combat(f"Collected {display_name}!")
                 else:
                     # Consumable item
-                    self.inventory[tile.item_id] += 1
-                    self.log_combat(f"Collected {display_name}! Total: {self.inventory[tile.item_id]}")
+                    self.consumables[tile.item_id] += 1
+                    self.log_combat(f"Collected {display_name}! Total: {self.consumables[tile.item_id]}")
 
                 # Play item collection sound
                 self.sound_manager.play_item_sound(tile.item_id)
 
                 # Add score for item collection
-                item_scores = {
-                    "missiles": 10, "supers": 20, "power_bombs": 30, "energy_tank": 50,
-                    "morph": 100, "bomb": 100, "hijump": 150, "speed": 150,
-                    "grapple": 200, "xray": 200, "spring": 150, "space": 200,
-                    "screw": 250, "charge": 150, "spazer": 200, "wave": 200,
-                    "ice": 200, "plasma": 250, "varia": 300, "gravity": 400
-                }
-                self.score += item_scores.get(tile.item_id, 10)
+                self.score += _ITEM_SCORES_ARR[tile.item_idx]
 
                 # Energy tanks increase max energy and heal fully
                 if tile.item_id == "energy_tank":
-                    self.max_energy += 100  # Permanently increase max energy
+                    self._recompute_derived()  # Picks up the new tank count
                     self.player_energy = self.max_energy  # Fully heal
                     self.log_combat(f"Energy tank collected! Max energy: {self.max_energy}")
 
                 # X-ray scope auto-grabs adjacent tiles if they are items
-                if self.inventory.get("xray", False):
+                if self.has_item("xray"):
                     self.auto_grab_adjacent_items(grid_x, grid_y)
 
             elif tile.tile_type == TileType.BOSS:
@@ -862,7 +1148,7 @@ class Game:
                 self.log_combat(f"Revealed enemy: {display_name} (HP: {tile.health})")
 
             # Check for Norfair damage (without Varia suit)
-            if tile.area == AreaType.NORFAIR and not self.inventory.get("varia", False):
+            if tile.area == AreaType.NORFAIR and not self.has_item("varia"):
                 self.player_energy -= 25
                 self.log_combat("Norfair heat damage! -25 energy")
                 if self.player_energy <= 0:
@@ -874,32 +1160,35 @@ class Game:
                     
     def can_click_tile(self, x: int, y: int) -> bool:
         """Check if a tile can be clicked (adjacent to revealed tiles or first tile)"""
+        mask = self.revealed_mask
         # First tile can be anywhere
-        if not self.revealed_tiles:
+        if mask == 0:
             return True
-            
-        # Check if adjacent to any revealed tile
-        for rx, ry in self.revealed_tiles:
-            if abs(x - rx) + abs(y - ry) == 1:  # Adjacent (manhattan distance = 1)
-                return True
-                
+
+        # Check if adjacent to any revealed tile (four bit tests, O(1))
+        idx = y * GRID_SIZE + x
+        if x > 0 and (mask >> (idx - 1)) & 1:
+            return True
+        if x < GRID_SIZE - 1 and (mask >> (idx + 1)) & 1:
+            return True
+        if y > 0 and (mask >> (idx - GRID_SIZE)) & 1:
+            return True
+        if y < GRID_SIZE - 1 and (mask >> (idx + GRID_SIZE)) & 1:
+            return True
+
         return False
     
     def has_revealed_neighbor(self, x: int, y: int) -> bool:
         """Check if a tile has a horizontally or vertically adjacent revealed tile"""
-        neighbors = [
-            (x, y - 1),  # Up
-            (x, y + 1),  # Down
-            (x - 1, y),  # Left
-            (x + 1, y)   # Right
-        ]
+        GS = GRID_SIZE
+        grid = self.grid
+        revealed_states = (TileState.FACE_UP, TileState.DESTROYED, TileState.PREVIEWED)
 
-        for nx, ny in neighbors:
-            if not (0 <= nx < GRID_SIZE and 0 <= ny < GRID_SIZE):
+        for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if not (0 <= nx < GS and 0 <= ny < GS):
                 continue
 
-            neighbor_tile = self.grid[ny][nx]
-            if neighbor_tile.state in (TileState.FACE_UP, TileState.DESTROYED, TileState.PREVIEWED):
+            if grid[ny * GS + nx].state in revealed_states:
                 return True
 
         return False
@@ -921,7 +1210,7 @@ class Game:
             if not (0 <= diag_x < GRID_SIZE and 0 <= diag_y < GRID_SIZE):
                 continue
             
-            tile = self.grid[diag_y][diag_x]
+            tile = self.grid[diag_y * GRID_SIZE + diag_x]
             
             if tile.tile_type != TileType.ITEM:
                 continue
@@ -931,45 +1220,43 @@ class Game:
                 continue
 
             # Check for Maridia movement restriction
-            if tile.area == AreaType.MARIDIA and not self.inventory.get("gravity", False):
+            if tile.area == AreaType.MARIDIA and not self.has_item("gravity"):
                 continue  # Skip Maridia tiles without gravity suit
             
             tile.state = TileState.FACE_UP
-            if (diag_x, diag_y) not in self.revealed_tiles:
-                self.revealed_tiles.append((diag_x, diag_y))
+            self.redraw_tile_cache(diag_x, diag_y)
+            self._mark_tile_dirty(diag_x, diag_y)
+            diag_bit = 1 << (diag_y * GRID_SIZE + diag_x)
+            if not (self.revealed_mask & diag_bit):
+                self.revealed_mask |= diag_bit
                 
                 # Collect the item
                 display_name = self.get_display_name(tile.item_id)
-                if isinstance(self.inventory[tile.item_id], bool):
-                    if not self.inventory[tile.item_id]:
-                        self.inventory[tile.item_id] = True
+                if tile.item_id in _UNIQUE_BITS:
+                    item_bit = _UNIQUE_BITS[tile.item_id]
+                    if not (self.acquired & item_bit):
+                        self.acquired |= item_bit
+                        self._recompute_derived()
                         self.log_combat(f"X-ray auto-collected {display_name}!")
                 else:
                     # Consumable item
-                    self.inventory[tile.item_id] += 1
-                    self.log_combat(f"X-ray auto-collected {display_name}! Total: {self.inventory[tile.item_id]}")
+                    self.consumables[tile.item_id] += 1
+                    self.log_combat(f"X-ray auto-collected {display_name}! Total: {self.consumables[tile.item_id]}")
                 
                 # Play item collection sound
                 self.sound_manager.play_item_sound(tile.item_id)
                 
                 # Add score for item collection
-                item_scores = {
-                    "missiles": 10, "supers": 20, "power_bombs": 30, "energy_tank": 50,
-                    "morph": 100, "bomb": 100, "hijump": 150, "speed": 150,
-                    "grapple": 200, "xray": 200, "spring": 150, "space": 200,
-                    "screw": 250, "charge": 150, "spazer": 200, "wave": 200,
-                    "ice": 200, "plasma": 250, "varia": 300, "gravity": 400
-                }
-                self.score += item_scores.get(tile.item_id, 10)
+                self.score += _ITEM_SCORES_ARR[tile.item_idx]
                 
                 # Energy tanks increase max energy and heal fully
                 if tile.item_id == "energy_tank":
-                    self.max_energy += 100
+                    self._recompute_derived()
                     self.player_energy = self.max_energy
                     self.log_combat(f"Energy tank collected! Max energy: {self.max_energy}")
                 
                 # Check for Norfair damage on auto-grabbed tiles
-                if tile.area == AreaType.NORFAIR and not self.inventory.get("varia", False):
+                if tile.area == AreaType.NORFAIR and not self.has_item("varia"):
                     self.player_energy -= 25
                     self.log_combat("Norfair heat damage! -25 energy")
                     if self.player_energy <= 0:
@@ -978,18 +1265,55 @@ class Game:
                         # Play death music and then stop all music
                         self.sound_manager.play_death_music()
         
+    def _make_tile_cover(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Build a TILE_SIZE cover surface (solid color + gray border)"""
+        surf = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
+        surf.fill(color)
+        pygame.draw.rect(surf, GRAY, surf.get_rect(), 2)
+        return surf
+
+    def _mark_tile_dirty(self, x: int, y: int):
+        """Queue a tile's screen region (plus neighbor covers) for display.update"""
+        # Matches the 3x3 patch redraw_tile_cache makes around a flipped tile
+        rect = pygame.Rect(GRID_START_X + (x - 1) * TILE_SIZE,
+                           GRID_START_Y + (y - 1) * TILE_SIZE,
+                           TILE_SIZE * 3, TILE_SIZE * 3)
+        self._dirty_rects.append(rect.clip(self.grid_rect))
+
+    def _rand(self) -> float:
+        """Next uniform [0, 1) draw from the pre-filled batch"""
+        i = self._rand_idx
+        if i >= 4096:
+            self._rand_pool = np.random.random(4096)
+            i = 0
+        self._rand_idx = i + 1
+        return self._rand_pool[i]
+
+    def _update_damage_bonus(self):
+        """Recompute the cached flat damage bonus after acquiring an item"""
+        acquired = self.acquired
+        self._damage_bonus = sum(
+            bonus for item_id, bonus in _DAMAGE_BONUSES
+            if acquired & _UNIQUE_BITS[item_id]
+        )
+
+    def _recompute_derived(self):
+        """Refresh stats derived from the inventory
+
+        Called on item pickup and game reset so per-frame code can read the
+        cached values instead of re-deriving them every tick.
+        """
+        self.max_energy = 99 + (self.consumables["energy_tank"] * 100)
+        self._attack_first_chance = self.get_attack_first_chance()
+        self._update_damage_bonus()
+        
+    def has_item(self, item_id: str) -> bool:
+        """Check whether a unique item has been acquired (single bit test)"""
+        return bool(self.acquired & _UNIQUE_BITS[item_id])
+
     def get_area_color(self, area_type: AreaType) -> Tuple[int, int, int]:
         """Get the color for an area type"""
-        area_colors = {
-            AreaType.CRATERIA: CRATERIA_LIGHT_BLUE,
-            AreaType.BRINSTAR: BRINSTAR_GREEN,
-            AreaType.NORFAIR: NORFAIR_RED,
-            AreaType.MARIDIA: MARIDIA_BLUE,
-            AreaType.TOURIAN: TOURIAN_YELLOW,
-            AreaType.WRECKED_SHIP: WRECKED_SHIP_PURPLE,
-            AreaType.CERES: CERES_GRAY
-        }
-        return area_colors.get(area_type, DARK_GRAY)
+        return _AREA_COLORS.get(area_type, DARK_GRAY)
         
     def get_area_display_name(self, area_type: AreaType) -> str:
         """Get a human-friendly name for an area"""
@@ -1010,28 +1334,27 @@ class Game:
         
     def log_combat(self, message: str):
         """Add a message to the combat log"""
-        self.combat_log.append(message)
-        # Keep only last 20 messages
-        if len(self.combat_log) > 28:
-            self.combat_log.pop(0)
-        print(message)  # Also print to console
+        self.combat_log.append(message)  # deque(maxlen=28) drops the oldest
+        self._dirty_rects.append(self.log_rect)
+        if self._debug_print:
+            print(message)  # Also print to console
         
     def get_attack_first_chance(self) -> float:
         """Calculate chance to attack first based on equipped items"""
         chance = 0.0
         
         # Movement items increase attack first chance by 25%
-        if self.inventory.get("space", False):
+        if self.has_item("space"):
             chance += 0.25
-        if self.inventory.get("hijump", False):
+        if self.has_item("hijump"):
             chance += 0.25
-        if self.inventory.get("morph", False):
+        if self.has_item("morph"):
             chance += 0.25
-        if self.inventory.get("spring", False):
+        if self.has_item("spring"):
             chance += 0.25
         
         # Speed booster increases by 50%
-        if self.inventory.get("speed", False):
+        if self.has_item("speed"):
             chance += 0.50
         
         return min(chance, 1.0)  # Cap at 100%
@@ -1042,28 +1365,28 @@ class Game:
         if self.game_over:
             return
             
-        # Update energy based on energy tanks
-        self.max_energy = 99 + (self.inventory.get("energy_tank", 0) * 100)
-        
         # Update combat - determine attack order based on items
         self.boss_turn_timer += 1
         self.player_attack_timer += 1
         
+        # Combat ticks touch health bars, log, energy, and score all at once,
+        # so just repaint the whole frame for them
+        if self.active_fight_count > 0:
+            self._full_redraw = True
+
         # Boss/Enemy attack cycle (every 60 frames = 1 second)
         if self.boss_turn_timer >= self.boss_turn_interval:
             self.boss_turn_timer = 0
-            player_attacks_first = random.random() < self.get_attack_first_chance()
+            player_attacks_first = self._rand() < self._attack_first_chance
             
             if player_attacks_first and self.is_fight_active():
                 # Player attacks first
                 self.process_player_attacks()
                 self.player_attack_timer = 0  # Reset player timer since we just attacked
-                self.process_enemy_turns()  # Then enemies
-                self.process_boss_turns()    # Then bosses
+                self._process_npc_turns()  # Then enemies and bosses
             else:
                 # Normal order: enemies/bosses first, then player
-                self.process_enemy_turns()
-                self.process_boss_turns()
+                self._process_npc_turns()
         
         # Player attacks more frequently (every 30 frames = 0.5 seconds)
         # Only attack if we didn't just attack via the boss turn
@@ -1071,214 +1394,148 @@ class Game:
             self.player_attack_timer = 0
             self.process_player_attacks()
             
-    def process_enemy_turns(self):
-        """Process enemy attacks on player"""
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                tile = self.grid[y][x]
-                if (tile.tile_type == TileType.ENEMY and 
-                    tile.state == TileState.FACE_UP and 
-                    tile.health > 0):
+    def _process_npc_turns(self):
+        """Process enemy and boss attacks in one fused pass
+
+        Enemies act before bosses, matching the order of the two loops this
+        replaces. Attacks stop once the player falls.
+        """
+        if not self.active_enemies and not self.active_bosses:
+            return
+        for tile in self.active_enemies + self.active_bosses:
+            # Check if combatant is frozen
+            if tile.frozen:
+                display_name = self.get_display_name(tile.item_id)
+                self.log_combat(f"{display_name} is frozen and skips turn!")
+                tile.frozen = False  # Unfreeze after turn
+                continue
+            
+            # Combatant attacks player
+            is_boss = tile.tile_type == TileType.BOSS
+            if is_boss:
+                damage = _BOSS_DAMAGE_ARR[tile.item_idx]
+            else:
+                damage = _ENEMY_DAMAGE_ARR[tile.item_idx]
+            self.player_energy -= damage
+            display_name = self.get_display_name(tile.item_id)
+            self.log_combat(f"{display_name} attacks for {damage} damage!")
+            
+            if self.player_energy <= 0:
+                if is_boss:
+                    self.player_energy = 0
+                self.game_over = True
+                self.log_combat("GAME OVER - Player defeated!")
+                # Play death music and then stop all music
+                self.sound_manager.play_death_music()
+                return
+            
+    def process_player_attacks(self):
+        """Process player attacks on bosses and enemies"""
+        if self.game_over or (not self.active_bosses and not self.active_enemies):
+            return
+        # Iterate a snapshot so defeated tiles can be removed mid-loop
+        for tile in self.active_bosses + self.active_enemies:
+            # Player attacks boss/enemy
+            damage = self.get_player_damage(tile.item_id)
+            tile.health -= damage
+            display_name = self.get_display_name(tile.item_id)
+            self.log_combat(f"Samus attacks {display_name} for {damage} dmg!")
+            
+            # Check for ice beam freeze (10% chance)
+            if (self.acquired & _MASK_ICE and 
+                tile.health > 0 and 
+                self._rand() < 0.10):
+                self.log_combat(f"{display_name} frozen! Extra turn!")
+                # Mark enemy as frozen (skip their next turn)
+                tile.frozen = True
+            
+            if tile.health <= 0:
+                tile.health = 0
+                tile.state = TileState.DESTROYED
+                self.redraw_tile_cache(tile.x, tile.y)
+                self.active_fight_count -= 1
+                if tile.tile_type == TileType.BOSS:
+                    self.active_bosses.remove(tile)
+                else:
+                    self.active_enemies.remove(tile)
+
+                # Handle boss defeats
+                if tile.tile_type == TileType.BOSS:
+                    self.boss_defeats[tile.item_id] += 1
                     
-                    # Check if enemy is frozen
-                    if tile.frozen:
-                        display_name = self.get_display_name(tile.item_id)
-                        self.log_combat(f"{display_name} is frozen and skips turn!")
-                        tile.frozen = False  # Unfreeze after turn
+                    # Special Ceres Station handling
+                    if tile.item_id == "ceres_station":
+                        self.log_combat("You saved Ceres Station!")
+                        self.log_combat("Ridley's life down by 1000!")
+                        # Reduce Ridley's health if he is still standing
+                        # (direct reference, no grid scan)
+                        ridley_tile = self._boss_refs.get("ridley")
+                        if ridley_tile is not None and ridley_tile.health > 0:
+                            ridley_tile.health = max(0, ridley_tile.health - 1000)
+                            self.log_combat(f"Ridley's health reduced to {ridley_tile.health}!")
+                        self.score += 600
                         continue
                     
-                    # Enemy attacks player
-                    damage = self.enemy_damage.get(tile.item_id, 3)
-                    self.player_energy -= damage
-                    display_name = self.get_display_name(tile.item_id)
-                    self.log_combat(f"{display_name} attacks for {damage} damage!")
-                    
-                    if self.player_energy <= 0:
+                    # Check for Mother Brain victory
+                    if tile.item_id == "mother_brain_1":
                         self.game_over = True
-                        self.log_combat("GAME OVER - Player defeated!")
-                        # Play death music and then stop all music
-                        self.sound_manager.play_death_music()
+                        self.victory = True
+                        self.log_combat("SAMUS WINS! Mother Brain defeated!")
+                        # Play ending music
+                        self.sound_manager.play_ending_music()
                         return
-            
-    def process_boss_turns(self):
-        """Process boss attacks"""
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                tile = self.grid[y][x]
-                if (tile.tile_type == TileType.BOSS and 
-                    tile.state == TileState.FACE_UP and 
-                    tile.health > 0):
-                    
-                    # Check if boss is frozen
-                    if tile.frozen:
-                        display_name = self.get_display_name(tile.item_id)
-                        self.log_combat(f"{display_name} is frozen and skips turn!")
-                        tile.frozen = False  # Unfreeze after turn
-                        continue
                     
-                    # Boss attacks player
-                    damage = self.get_boss_damage(tile.item_id)
-                    self.player_energy -= damage
+                    # Add score for boss defeat
+                    boss_score = _BOSS_SCORES_ARR[tile.item_idx]
+                    self.score += boss_score
                     display_name = self.get_display_name(tile.item_id)
-                    self.log_combat(f"{display_name} attacks for {damage} damage!")
+                    self.log_combat(f"{display_name} defeated! Score: +{boss_score}")
                     
-                    if self.player_energy <= 0:
-                        self.player_energy = 0
-                        self.game_over = True
-                        self.log_combat("GAME OVER - Player defeated!")
-                        # Play death music and then stop all music
-                        self.sound_manager.play_death_music()
-                        
-    def process_player_attacks(self):
-        """Process player attacks on bosses and enemies"""
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                tile = self.grid[y][x]
-                if ((tile.tile_type == TileType.BOSS or tile.tile_type == TileType.ENEMY) and 
-                    tile.state == TileState.FACE_UP and 
-                    tile.health > 0):
+                    # Play explosion/death sound for boss
+                    self.sound_manager.play_sound("explosion")
                     
-                    # Player attacks boss/enemy
-                    damage = self.get_player_damage(tile.item_id)
-                    tile.health -= damage
+                    # Restore area music after boss defeat if no other fights active
+                    if not self.is_fight_active():
+                        phantoon_defeated = self.boss_defeats.get("phantoon", 0) > 0
+                        if self.last_clicked_area:
+                            self.sound_manager.play_area_music(self.last_clicked_area, phantoon_defeated)
+                
+                # Handle enemy defeats
+                elif tile.tile_type == TileType.ENEMY:
+                    enemy_score = _ENEMY_SCORES_ARR[tile.item_idx]
+                    self.score += enemy_score
                     display_name = self.get_display_name(tile.item_id)
-                    self.log_combat(f"Samus attacks {display_name} for {damage} dmg!")
+                    self.log_combat(f"{display_name} defeated! Score: +{enemy_score}")
                     
-                    # Check for ice beam freeze (10% chance)
-                    if (self.inventory.get("ice", False) and 
-                        tile.health > 0 and 
-                        random.random() < 0.10):
-                        self.log_combat(f"{display_name} frozen! Extra turn!")
-                        # Mark enemy as frozen (skip their next turn)
-                        tile.frozen = True
+                    # Play enemy death sound
+                    self.sound_manager.play_sound("enemy_death")
                     
-                    if tile.health <= 0:
-                        tile.health = 0
-                        tile.state = TileState.DESTROYED
-                        
-                        # Handle boss defeats
-                        if tile.tile_type == TileType.BOSS:
-                            self.boss_defeats[tile.item_id] += 1
-                            
-                            # Special Ceres Station handling
-                            if tile.item_id == "ceres_station":
-                                self.log_combat("You saved Ceres Station!")
-                                self.log_combat("Ridley's life down by 1000!")
-                                # Reduce Ridley's health if he exists
-                                for y2 in range(GRID_SIZE):
-                                    for x2 in range(GRID_SIZE):
-                                        ridley_tile = self.grid[y2][x2]
-                                        if (ridley_tile.tile_type == TileType.BOSS and 
-                                            ridley_tile.item_id == "ridley" and 
-                                            ridley_tile.health > 0):
-                                            ridley_tile.health = max(0, ridley_tile.health - 1000)
-                                            self.log_combat(f"Ridley's health reduced to {ridley_tile.health}!")
-                                self.score += 600
-                                continue
-                            
-                            # Check for Mother Brain victory
-                            if tile.item_id == "mother_brain_1":
-                                self.game_over = True
-                                self.victory = True
-                                self.log_combat("SAMUS WINS! Mother Brain defeated!")
-                                # Play ending music
-                                self.sound_manager.play_ending_music()
-                                return
-                            
-                            # Add score for boss defeat
-                            boss_scores = {
-                                "bomb_torizo": 500, "spore_spawn": 800, "kraid": 2000, "crocomire": 1200,
-                                "phantoon": 1500, "botwoon": 1000, "draygon": 1800, "gold_torizo": 1600,
-                                "ridley": 2500, "mother_brain_1": 5000, "mother_brain_2": 3000,
-                                "samus_ship": 800, "golden_four": 4000
-                            }
-                            self.score += boss_scores.get(tile.item_id, 1000)
-                            display_name = self.get_display_name(tile.item_id)
-                            self.log_combat(f"{display_name} defeated! Score: +{boss_scores.get(tile.item_id, 1000)}")
-                            
-                            # Play explosion/death sound for boss
-                            self.sound_manager.play_sound("explosion")
-                            
-                            # Restore area music after boss defeat if no other fights active
-                            if not self.is_fight_active():
-                                phantoon_defeated = self.boss_defeats.get("phantoon", 0) > 0
-                                if self.last_clicked_area:
-                                    self.sound_manager.play_area_music(self.last_clicked_area, phantoon_defeated)
-                        
-                        # Handle enemy defeats
-                        elif tile.tile_type == TileType.ENEMY:
-                            enemy_scores = {
-                                "geemer": 25, "skree": 35, "side_hopper": 50, "ciser": 75, "metroid": 150
-                            }
-                            self.score += enemy_scores.get(tile.item_id, 25)
-                            display_name = self.get_display_name(tile.item_id)
-                            self.log_combat(f"{display_name} defeated! Score: +{enemy_scores.get(tile.item_id, 25)}")
-                            
-                            # Play enemy death sound
-                            self.sound_manager.play_sound("enemy_death")
-                            
-                            # Restore area music after enemy defeat if no other fights active
-                            if not self.is_fight_active():
-                                phantoon_defeated = self.boss_defeats.get("phantoon", 0) > 0
-                                if self.last_clicked_area:
-                                    self.sound_manager.play_area_music(self.last_clicked_area, phantoon_defeated)
-                        
-    def get_boss_damage(self, boss_id: str) -> int:
-        """Get boss attack damage"""
-        boss_damage = {
-            "bomb_torizo": 5,
-            "spore_spawn": 8,
-            "kraid": 15,
-            "crocomire": 10,
-            "phantoon": 12,
-            "botwoon": 6,
-            "draygon": 20,
-            "gold_torizo": 18,
-            "ridley": 25,
-            "mother_brain_1": 30,
-            "mother_brain_2": 20,
-            "samus_ship": 3,
-            "ceres_station": 4,
-            "golden_four": 35
-        }
-        return boss_damage.get(boss_id, 10)
-        
+                    # Restore area music after enemy defeat if no other fights active
+                    if not self.is_fight_active():
+                        phantoon_defeated = self.boss_defeats.get("phantoon", 0) > 0
+                        if self.last_clicked_area:
+                            self.sound_manager.play_area_music(self.last_clicked_area, phantoon_defeated)
+                
     def get_player_damage(self, boss_id: str) -> int:
         """Get player damage against boss - beams, speed booster, and missiles add damage"""
-        base_damage = 10
-        
-        # Beam weapons and speed booster add to damage
-        if self.inventory.get("charge", False):
-            base_damage += 20
-        if self.inventory.get("ice", False):
-            base_damage += 20
-        if self.inventory.get("spazer", False):
-            base_damage += 30
-        if self.inventory.get("wave", False):
-            base_damage += 20
-        if self.inventory.get("plasma", False):
-            base_damage += 25
-        if self.inventory.get("screw", False):
-            base_damage += 50  # Screw attack is powerful
-        if self.inventory.get("speed", False):
-            base_damage += 20  # Speed booster adds damage
-        if self.inventory.get("bomb", False):
-            base_damage += 50  # Bombs add significant attack damage
-            
+        # Beam/suit bonuses are cached in _damage_bonus (see _update_damage_bonus)
+        base_damage = 10 + self._damage_bonus
+        
         # Missile bonuses with proper scaling
         missile_base = 10  # Base missile damage
-        base_damage += self.inventory.get("missiles", 0) * missile_base
-        base_damage += self.inventory.get("supers", 0) * (missile_base * 2)  # 2x missile damage
-        base_damage += self.inventory.get("power_bombs", 0) * (missile_base * 3)  # 3x missile damage
+        base_damage += self.consumables["missiles"] * missile_base
+        base_damage += self.consumables["supers"] * (missile_base * 2)  # 2x missile damage
+        base_damage += self.consumables["power_bombs"] * (missile_base * 3)  # 3x missile damage
         
         # Special boss interactions
-        if boss_id == "draygon" and self.inventory.get("grapple", False):
+        acquired = self.acquired
+        if boss_id == "draygon" and acquired & _MASK_GRAPPLE:
             base_damage *= 3
             self.log_combat("Grappling beam bonus vs Draygon! 3x damage!")
         
         # Special enemy interactions - Metroids
         if boss_id == "metroid":
-            if self.inventory.get("ice", False):
+            if acquired & _MASK_ICE:
                 base_damage *= 2  # Double damage with Ice Beam
                 self.log_combat("Ice Beam is super effective against Metroids! 2x damage!")
             else:
@@ -1286,118 +1543,157 @@ class Game:
                 self.log_combat("Metroids are resistant! Need Ice Beam for full damage!")
             
         # Suit bonuses
-        if self.inventory.get("varia", False):
+        if acquired & _MASK_VARIA:
             base_damage = int(base_damage * 1.25)  # 25% damage boost
-        if self.inventory.get("gravity", False):
+        if acquired & _MASK_GRAVITY:
             base_damage = int(base_damage * 1.5)   # 50% damage boost
             
         return base_damage
         
     def render(self):
         """Render the game"""
+        # Idle frames (no dirty regions, no combat repaint pending) skip the
+        # whole back-buffer repaint, not just the present
+        if not self._full_redraw and not self._dirty_rects and not self._hud_dirty:
+            return
+
         self.screen.fill(BLACK)
-        
+
         # Draw energy display
         self.draw_energy_display()
-        
-        # Draw inventory
-        self.draw_inventory()
-        
+
+        # The batched HUD draws report the rects they actually touched
+        # (copy: draw_inventory hands back its cached slot-rect list)
+        hud_rects = list(self.draw_inventory())
+
         # Draw grid
         self.draw_grid()
-        
+
         # Draw combat info
         self.draw_combat_info()
-        
-        # Draw boss tracker
-        self.draw_boss_tracker()
-        
-        pygame.display.flip()
-        
-    def draw_grid(self):
-        """Draw the game grid"""
+
+        hud_rects += self.draw_boss_tracker()
+
+        # Present only what changed; idle frames push nothing at all
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            if self._hud_dirty:
+                self._dirty_rects.append(self._energy_rect)
+                self._dirty_rects.extend(hud_rects)
+            if self._dirty_rects:
+                pygame.display.update(self._dirty_rects)
+        self._dirty_rects.clear()
+        self._hud_dirty = False
+        
+    def build_board_surface(self):
+        """Pre-render the entire board's static art into one cached surface
+
+        draw_grid blits this once per frame; state changes patch it in place
+        via redraw_tile_cache, so the face-down background is never redrawn
+        tile-by-tile.
+        """
+        self.board_surface = pygame.Surface((GRID_SIZE * TILE_SIZE,
+                                             GRID_SIZE * TILE_SIZE)).convert()
         for y in range(GRID_SIZE):
             for x in range(GRID_SIZE):
-                tile = self.grid[y][x]
-                screen_x, screen_y = tile.get_screen_position()
-                
-                if tile.state == TileState.FACE_DOWN:
-                    if self.has_revealed_neighbor(x, y):
-                        area_color = self.get_area_color(tile.area)
-                        pygame.draw.rect(self.screen, area_color,
-                                         (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-                    else:
-                        pygame.draw.rect(self.screen, DARK_TAN,
-                                         (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-                    pygame.draw.rect(self.screen, GRAY,
-                                   (screen_x, screen_y, TILE_SIZE, TILE_SIZE), 2)
-                elif tile.state == TileState.PREVIEWED:
-                    # Show the area's color but keep contents hidden
-                    area_color = self.get_area_color(tile.area)
-                    pygame.draw.rect(self.screen, area_color,
-                                   (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-                    pygame.draw.rect(self.screen, GRAY,
-                                   (screen_x, screen_y, TILE_SIZE, TILE_SIZE), 2)
-                elif tile.state == TileState.FACE_UP:
-                    # Draw face-up tile with sprite - all tiles have black background
-                    pygame.draw.rect(self.screen, BLACK, 
-                                   (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-                    pygame.draw.rect(self.screen, GRAY, 
-                                   (screen_x, screen_y, TILE_SIZE, TILE_SIZE), 2)
-                    
-                    # Draw sprite
-                    if tile.tile_type == TileType.ITEM:
-                        self.sprite_manager.draw_item(self.screen, tile.item_id, 
-                                                    screen_x, screen_y, TILE_SIZE)
-                    elif tile.tile_type == TileType.BOSS:
-                        self.sprite_manager.draw_boss(self.screen, tile.item_id, 
+                self.draw_tile_to_board(x, y)
+
+    def redraw_tile_cache(self, x: int, y: int):
+        """Re-render a tile (and its neighbors) into the cached board surface"""
+        # Neighbors are included because the face-down cover color depends
+        # on whether an adjacent tile has been revealed
+        for ny in range(max(0, y - 1), min(GRID_SIZE, y + 2)):
+            for nx in range(max(0, x - 1), min(GRID_SIZE, x + 2)):
+                self.draw_tile_to_board(nx, ny)
+
+    def draw_tile_to_board(self, x: int, y: int):
+        """Draw a single tile's static art into the cached board surface"""
+        tile = self.grid[y * GRID_SIZE + x]
+        screen_x = x * TILE_SIZE
+        screen_y = y * TILE_SIZE
+        surface = self.board_surface
+
+        if tile.state == TileState.FACE_DOWN:
+            if self.has_revealed_neighbor(x, y):
+                surface.blit(self._area_covers[tile.area], (screen_x, screen_y))
+            else:
+                surface.blit(self._hidden_cover, (screen_x, screen_y))
+        elif tile.state == TileState.PREVIEWED:
+            # Show the area's color but keep contents hidden
+            surface.blit(self._area_covers[tile.area], (screen_x, screen_y))
+        elif tile.state == TileState.FACE_UP:
+            # Draw face-up tile with sprite - all tiles have black background
+            surface.blit(self._revealed_bg, (screen_x, screen_y))
+
+            # Draw sprite (health bars are drawn per-frame in draw_grid)
+            if tile.tile_type == TileType.ITEM:
+                self.sprite_manager.draw_item(surface, tile.item_id,
+                                            screen_x, screen_y, TILE_SIZE)
+            elif tile.tile_type == TileType.BOSS:
+                self.sprite_manager.draw_boss(surface, tile.item_id,
+                                            screen_x, screen_y, TILE_SIZE)
+            elif tile.tile_type == TileType.ENEMY:
+                self.sprite_manager.draw_enemy(surface, tile.item_id,
+                                             screen_x, screen_y, TILE_SIZE)
+        elif tile.state == TileState.DESTROYED:
+            # Draw destroyed boss as grayscaled sprite
+            surface.blit(self._revealed_bg, (screen_x, screen_y))
+
+            # Draw grayscaled boss/enemy sprite
+            if tile.tile_type == TileType.BOSS:
+                self.sprite_manager.draw_boss_grayed(surface, tile.item_id,
+                                                   screen_x, screen_y, TILE_SIZE)
+            elif tile.tile_type == TileType.ENEMY:
+                self.sprite_manager.draw_enemy_grayed(surface, tile.item_id,
                                                     screen_x, screen_y, TILE_SIZE)
-                        
-                        # Draw boss health bar at bottom of tile (skip ship)
-                        if tile.item_id != "samus_ship":
-                            self.draw_health_bar(screen_x, screen_y + TILE_SIZE - 4, 
-                                               tile.health, tile.max_health)
-                                               
-                    elif tile.tile_type == TileType.ENEMY:
-                        self.sprite_manager.draw_enemy(self.screen, tile.item_id, 
-                                                     screen_x, screen_y, TILE_SIZE)
-                        
-                        # Draw enemy health bar at bottom of tile (always show for enemies)
-                        self.draw_health_bar(screen_x, screen_y + TILE_SIZE - 4, 
-                                           tile.health, tile.max_health)
-                elif tile.state == TileState.DESTROYED:
-                    # Draw destroyed boss as grayscaled sprite
-                    pygame.draw.rect(self.screen, BLACK, 
-                                   (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-                    pygame.draw.rect(self.screen, GRAY, 
-                                   (screen_x, screen_y, TILE_SIZE, TILE_SIZE), 2)
-                    
-                    # Draw grayscaled boss/enemy sprite
-                    if tile.tile_type == TileType.BOSS:
-                        self.sprite_manager.draw_boss_grayed(self.screen, tile.item_id, 
-                                                           screen_x, screen_y, TILE_SIZE)
-                    elif tile.tile_type == TileType.ENEMY:
-                        self.sprite_manager.draw_enemy_grayed(self.screen, tile.item_id, 
-                                                            screen_x, screen_y, TILE_SIZE)
-                                            
+
+    def draw_grid(self):
+        """Draw the game grid (one blit of the cached board + live overlays)"""
+        self.screen.blit(self.board_surface, (GRID_START_X, GRID_START_Y))
+
+        # Health bars change every combat tick, so overlay them per frame.
+        # Only live face-up combatants carry bars, and those are exactly the
+        # tiles in the active lists - no full-grid scan needed.
+        TS = TILE_SIZE
+        for tile in self.active_bosses + self.active_enemies:
+            screen_x, screen_y = tile.get_screen_position()
+            self.draw_health_bar(screen_x, screen_y + TS - 4,
+                               tile.health, tile.max_health)
+
     def draw_health_bar(self, x: int, y: int, current: int, maximum: int):
         """Draw a health bar at bottom of tile"""
         bar_width = TILE_SIZE
         bar_height = 4  # Half height, on tile
         health_ratio = current / maximum if maximum > 0 else 0
         
+        # Solid rects go through Surface.fill, which dispatches faster than
+        # pygame.draw.rect; only the 1px border still needs draw.rect
         # Background (dark red)
-        pygame.draw.rect(self.screen, (120, 0, 0), (x, y, bar_width, bar_height))
+        self.screen.fill((120, 0, 0), (x, y, bar_width, bar_height))
         # Border
         pygame.draw.rect(self.screen, WHITE, (x, y, bar_width, bar_height), 1)
         # Health (bright green)
         if health_ratio > 0:
             health_width = int(bar_width * health_ratio)
-            pygame.draw.rect(self.screen, (0, 255, 0), (x, y, health_width, bar_height))
-        
+            self.screen.fill((0, 255, 0), (x, y, health_width, bar_height))
+        
+    def _render(self, font, text: str, color) -> pygame.Surface:
+        """Render text through a memo cache (glyph rasterization is costly)"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Simple FIFO cap so score/count churn can't grow it unbounded
+            if len(self._text_cache) >= 512:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
     def draw_energy_display(self):
         """Draw energy display like Metroid (tanks + remainder)"""
-        font = pygame.font.Font(None, 24)
+        font = self._font24
         x = 10
         y = 10
         
@@ -1432,58 +1728,38 @@ class Game:
         # Calculate position based on actual number of tanks drawn
         actual_tanks_this_row = min(total_tanks, tanks_per_row)
         number_x = x + (actual_tanks_this_row * (tank_size + tank_spacing)) + 15
-        energy_text = font.render(str(remainder), True, WHITE)
+        energy_text = self._render(font, str(remainder), WHITE)
         self.screen.blit(energy_text, (number_x, y))
         
+    def _inventory_bits(self) -> int:
+        """Bitmask of owned inventory slots, in _INVENTORY_ORDER"""
+        # Slots 0-3 are the consumables; unique items follow in the same
+        # order as their acquired bits
+        bits = self.acquired << 4
+        consumables = self.consumables
+        if consumables["missiles"]:
+            bits |= 1
+        if consumables["supers"]:
+            bits |= 2
+        if consumables["power_bombs"]:
+            bits |= 4
+        if consumables["energy_tank"]:
+            bits |= 8
+        return bits
+
     def draw_inventory(self):
-        """Draw the two-row inventory bar to the right of energy display"""
-        # Start inventory to the right of energy display
-        start_x = 320  # Right of energy tanks
-        y = INVENTORY_Y
-        
-        # Organize items into two rows
-        items = list(self.inventory.keys())
-        items_per_row = len(items) // 2
-        item_size = 32
-        item_spacing = 2  # Minimal spacing between icons
-        
-        # Row 1 (top)
-        for i, item_id in enumerate(items[:items_per_row]):
-            x = start_x + i * (item_size + item_spacing)
-            
-            # Draw item icon
-            has_item = self.inventory[item_id] if isinstance(self.inventory[item_id], bool) else self.inventory[item_id] > 0
-            if has_item:
-                self.sprite_manager.draw_item(self.screen, item_id, x, y, item_size)
-            else:
-                self.sprite_manager.draw_item_grayed(self.screen, item_id, x, y, item_size)
-                
-            # Draw count on bottom-right of icon (only for consumables)
-            if not isinstance(self.inventory[item_id], bool):
-                count = self.inventory[item_id]
-                if count > 0:
-                    font = pygame.font.Font(None, 16)
-                    text = font.render(str(count), True, WHITE)
-                    self.screen.blit(text, (x + 20, y + 20))
-                
-        # Row 2 (bottom)
-        for i, item_id in enumerate(items[items_per_row:]):
-            x = start_x + i * (item_size + item_spacing)
-            
-            # Draw item icon
-            has_item = self.inventory[item_id] if isinstance(self.inventory[item_id], bool) else self.inventory[item_id] > 0
-            if has_item:
-                self.sprite_manager.draw_item(self.screen, item_id, x, y + 35, item_size)
-            else:
-                self.sprite_manager.draw_item_grayed(self.screen, item_id, x, y + 35, item_size)
-                
-            # Draw count on bottom-right of icon (only for consumables)
-            if not isinstance(self.inventory[item_id], bool):
-                count = self.inventory[item_id]
-                if count > 0:
-                    font = pygame.font.Font(None, 16)
-                    text = font.render(str(count), True, WHITE)
-                    self.screen.blit(text, (x + 20, y + 55))
+        """Draw the two-row inventory bar; returns the slot rects touched"""
+        # Generated straight-line blit sequence for the fixed icon layout
+        self._draw_inv_icons(self.screen, self._inventory_bits(),
+                             self._inv_icons, self._inv_icons_gray)
+
+        # Counts on bottom-right of icons (only for consumables)
+        for item_id, x, y in self._consumable_slots:
+            count = self.consumables[item_id]
+            if count > 0:
+                self.screen.blit(self._render(self._font16, str(count), WHITE),
+                                 (x + 20, y + 20))
+        return self._inv_rects
                 
     def draw_combat_info(self):
         """Draw combat information to the right of grid"""
@@ -1496,12 +1772,12 @@ class Game:
         pygame.draw.rect(self.screen, GRAY, (x, y, HUD_WIDTH, height), 2)
         
         # Title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Log", True, WHITE)
+        font = self._font24
+        title = self._render(font, "Log", WHITE)
         self.screen.blit(title, (x + 10, y + 10))
         
         # Combat log - calculate how many messages can actually fit
-        font_small = pygame.font.Font(None, 20)  # Bigger text
+        font_small = self._font20  # Bigger text
         log_start_y = y + 35  # Start below title
         stats_start_y = y + height - 90  # Stats area starts here
         available_height = stats_start_y - log_start_y
@@ -1510,70 +1786,49 @@ class Game:
         
         # Show as many messages as can fit
         messages_to_show = min(max_messages, len(self.combat_log))
-        for i, message in enumerate(self.combat_log[-messages_to_show:]):
-            text = font_small.render(message, True, WHITE)
+        recent = islice(self.combat_log, len(self.combat_log) - messages_to_show, None)
+        for i, message in enumerate(recent):
+            text = self._render(font_small, message, WHITE)
             self.screen.blit(text, (x + 10, log_start_y + i * line_height))
             
         # Current stats at bottom (fixed position)
         y_stats = y + height - 90  # More space for additional messages
-        stats_font = pygame.font.Font(None, 20)
+        stats_font = self._font20
         
         # Game over/victory message (fixed position, doesn't push stats)
         if self.game_over:
-            game_over_font = pygame.font.Font(None, 32)
+            game_over_font = self._font32
             if self.victory:
-                message_text = game_over_font.render("SAMUS WINS", True, BRINSTAR_GREEN)
+                message_text = self._render(game_over_font, "SAMUS WINS", BRINSTAR_GREEN)
             else:
-                message_text = game_over_font.render("GAME OVER", True, NORFAIR_RED)
+                message_text = self._render(game_over_font, "GAME OVER", NORFAIR_RED)
             # Show message at fixed position above stats
             self.screen.blit(message_text, (x + 10, y_stats - 50))
         
         # Player damage
         damage = self.get_player_damage("")  # Get base damage
-        damage_text = stats_font.render(f"Base Damage: {damage}", True, WHITE)
+        damage_text = self._render(stats_font, f"Base Damage: {damage}", WHITE)
         self.screen.blit(damage_text, (x + 10, y_stats))
         
         # Score
-        score_text = stats_font.render(f"Score: {self.score}", True, WHITE)
+        score_text = self._render(stats_font, f"Score: {self.score}", WHITE)
         self.screen.blit(score_text, (x + 10, y_stats + 25))
         
         # Reset instruction
-        reset_text = stats_font.render("Press R to Reset", True, GRAY)
+        reset_text = self._render(stats_font, "Press R to Reset", GRAY)
         self.screen.blit(reset_text, (x + 10, y_stats + 50))
             
     def draw_boss_tracker(self):
-        """Draw boss tracker in top right (like item HUD)"""
-        x = BOSS_HUD_X
-        y = INVENTORY_Y
-        
-        # Boss icons in two rows (no background, no title) - removed ship, ceres_station, and golden_four
-        boss_list = [
-            "bomb_torizo", "spore_spawn", "kraid", "crocomire",
-            "phantoon", "botwoon", "draygon", "gold_torizo",
-            "ridley", "mother_brain_1"
-        ]
-        
+        """Draw boss tracker in top right (like item HUD); returns icon rects"""
         icon_size = 32  # Match item HUD size
-        icons_per_row = 5  # Even rows: 6 per row for 11 bosses
-        spacing = 2
-        
-        # Calculate starting position to right-align
-        total_width = icons_per_row * (icon_size + spacing) - spacing
-        start_x = x + (BOSS_HUD_WIDTH - total_width)
-        
-        for i, boss_id in enumerate(boss_list):
-            row = i // icons_per_row
-            col = i % icons_per_row
-            icon_x = start_x + col * (icon_size + spacing)
-            icon_y = y + row * (icon_size + spacing)
-            
-            # Draw boss icon (no counters, just defeated/not defeated)
-            if self.boss_defeats[boss_id] > 0:
-                # Defeated - show normal sprite
-                self.sprite_manager.draw_boss(self.screen, boss_id, icon_x, icon_y, icon_size)
-            else:
-                # Not defeated - show grayed out
-                self.sprite_manager.draw_boss_grayed(self.screen, boss_id, icon_x, icon_y, icon_size)
+        icon_blits = []
+        for boss_id, x, y in self._boss_slots:
+            # Defeated bosses show normally, undefeated ones grayed out
+            sprite = self.sprite_manager.get_boss(boss_id, icon_size,
+                                                  gray=self.boss_defeats[boss_id] == 0)
+            if sprite is not None:
+                icon_blits.append((sprite, (x, y)))
+        return self.screen.blits(icon_blits)
                 
         
     def run(self):
@@ -1588,15 +1843,63 @@ class Game:
         sys.exit()
 
 class SpriteManager:
-    """Manages sprite loading and drawing"""
+    """Manages sprite loading and drawing
+
+    All sprites are built eagerly at startup: the inventory and boss
+    tracker draw every icon (gray or not) from the very first frame, so
+    there is no unused subset to defer. Only rescales to sizes outside
+    the pre-scaled set happen lazily, via _scale_cache.
+    """
+    __slots__ = ('boss_sprites', 'item_sprites', 'enemy_sprites',
+                 'boss_sprites_gray', 'item_sprites_gray', 'enemy_sprites_gray',
+                 'boss_sprites_by_size', 'item_sprites_by_size',
+                 'enemy_sprites_by_size', 'boss_gray_by_size',
+                 'item_gray_by_size', 'enemy_gray_by_size',
+                 '_scale_cache', '_scale', '_scale2x', '_tables')
+
     def __init__(self):
         self.boss_sprites = {}
         self.item_sprites = {}
         self.enemy_sprites = {}
+        # Grayed-out variants, computed once at load instead of per draw call
+        self.boss_sprites_gray = {}
+        self.item_sprites_gray = {}
+        self.enemy_sprites_gray = {}
+        # Pre-scaled copies at the sizes the game draws (board tiles and
+        # 32px HUD icons), so draw calls never resample at render time
+        self.boss_sprites_by_size = {}
+        self.item_sprites_by_size = {}
+        self.enemy_sprites_by_size = {}
+        self.boss_gray_by_size = {}
+        self.item_gray_by_size = {}
+        self.enemy_gray_by_size = {}
+        # On-demand cache for draw sizes outside the pre-scaled set, so even
+        # novel sizes only ever pay for one rescale
+        self._scale_cache: Dict[tuple, pygame.Surface] = {}
+        # Pre-bound to skip the pygame.transform module-attribute walk on
+        # every rescale
+        self._scale = pygame.transform.scale
+        self._scale2x = pygame.transform.scale2x
         self.load_sprites()
+        # (kind, gray) -> (base dict, pre-scaled dict); one table drives the
+        # shared _draw path instead of six near-identical methods
+        self._tables = {
+            ("boss", False): (self.boss_sprites, self.boss_sprites_by_size),
+            ("boss", True): (self.boss_sprites_gray, self.boss_gray_by_size),
+            ("item", False): (self.item_sprites, self.item_sprites_by_size),
+            ("item", True): (self.item_sprites_gray, self.item_gray_by_size),
+            ("enemy", False): (self.enemy_sprites, self.enemy_sprites_by_size),
+            ("enemy", True): (self.enemy_sprites_gray, self.enemy_gray_by_size),
+        }
         
     def load_sprites(self):
-        """Load all sprites from sprite sheets"""
+        """Load all sprites from sprite sheets
+
+        The sheets are convert_alpha()'d immediately, so every derived
+        surface (subsurface views, gray copies, pre-scaled sizes) already
+        matches the display pixel format and blits on the SDL fast path.
+        Must run after pygame.display.set_mode().
+        """
         try:
             # Load boss sprites
             boss_sheet = pygame.image.load("boss_sprites.png").convert_alpha()
@@ -1609,134 +1912,169 @@ class SpriteManager:
             # Load enemy sprites (4 enemies in a row, 32x32 each)
             enemy_sheet = pygame.image.load("enemies.png").convert_alpha()
             self.enemy_sprites = self.load_enemy_sprites(enemy_sheet, 32, 32)
+
+            # Build the gray variants up front
+            self.boss_sprites_gray = self.make_gray_variants(self.boss_sprites)
+            self.item_sprites_gray = self.make_gray_variants(self.item_sprites)
+            self.enemy_sprites_gray = self.make_gray_variants(self.enemy_sprites)
+
+            # Sheet ownership: the locals above go out of scope here, but
+            # each subsurface view keeps its parent sheet alive, so the
+            # base pixels exist exactly once (in the sheets). Only the
+            # gray and pre-scaled variants own separate pixel storage.
+
+            # Pre-scale everything at the known draw sizes
+            self.boss_sprites_by_size = self.scale_by_size(self.boss_sprites)
+            self.item_sprites_by_size = self.scale_by_size(self.item_sprites)
+            self.enemy_sprites_by_size = self.scale_by_size(self.enemy_sprites)
+            self.boss_gray_by_size = self.scale_by_size(self.boss_sprites_gray)
+            self.item_gray_by_size = self.scale_by_size(self.item_sprites_gray)
+            self.enemy_gray_by_size = self.scale_by_size(self.enemy_sprites_gray)
             
         except pygame.error as e:
             print(f"Error loading sprites: {e}")
             
+    def make_gray_variants(self, sprites: Dict[str, pygame.Surface]) -> Dict[str, pygame.Surface]:
+        """Build grayed-out copies of a sprite dict (for locked HUD icons)
+
+        Runs once at load; the per-pixel BLEND_RGBA_MULT pass never happens
+        at draw time, and the gray dicts feed the same pre-scale/size cache
+        as the normal sprites.
+        """
+        gray_sprites = {}
+        for name, sprite in sprites.items():
+            grayed = sprite.copy()
+            # Halve every channel in one vectorized pass; equivalent to the
+            # old BLEND_RGBA_MULT (128, 128, 128, 128) fill but done by
+            # NumPy instead of SDL's generic blend path
+            rgb = pygame.surfarray.pixels3d(grayed)
+            rgb >>= 1
+            del rgb
+            alpha = pygame.surfarray.pixels_alpha(grayed)
+            alpha >>= 1
+            del alpha
+            gray_sprites[name] = grayed
+        return gray_sprites
+
+    def scale_by_size(self, sprites: Dict[str, pygame.Surface],
+                      sizes: tuple = (TILE_SIZE, 32)) -> Dict[int, Dict[str, pygame.Surface]]:
+        """Pre-scale a sprite dict at each target draw size
+
+        The copies are convert_alpha()'d so every hot-path blit source
+        already matches the display pixel format.
+        """
+        resize = self._resize
+        return {sz: {name: resize(sprite, sz).convert_alpha()
+                     for name, sprite in sprites.items()}
+                for sz in sizes}
+
+    def _resize(self, sprite: pygame.Surface, size: int) -> pygame.Surface:
+        """Resize a square sprite, taking the scale2x fast path for exact 2x
+
+        scale2x is the SIMD-tuned pixel-art doubler; everything else keeps
+        nearest-neighbor scale (smoothscale would blur these sprites).
+        """
+        if size == sprite.get_width() * 2:
+            return self._scale2x(sprite)
+        return self._scale(sprite, (size, size))
+
+    def _get_scaled(self, sprites: Dict[str, pygame.Surface],
+                    by_size: Dict[int, Dict[str, pygame.Surface]],
+                    name: str, size: int):
+        """Fetch a sprite at the given size, rescaling at most once
+
+        This covers gray variants too: a cache miss costs one rescale of
+        the pre-grayed base, never a copy-plus-blend at draw time, so no
+        scratch surface is needed on the miss path.
+        """
+        sized = by_size.get(size)
+        if sized is not None:
+            return sized.get(name)
+        key = (id(sprites), name, size)
+        scaled = self._scale_cache.get(key)
+        if scaled is None:
+            sprite = sprites.get(name)
+            if sprite is None:
+                return None
+            scaled = self._resize(sprite, size)
+            self._scale_cache[key] = scaled
+        return scaled
+
     def load_sprite_sheet(self, sheet: pygame.Surface, sprite_width: int, sprite_height: int) -> Dict[str, pygame.Surface]:
-        """Load individual sprites from a sprite sheet"""
+        """Load individual sprites from a sprite sheet
+
+        Each entry is a subsurface view, so the sheet itself is the single
+        backing atlas: blitting a view is a source-rect blit from the sheet
+        with no per-cell pixel storage.
+        """
         sprites = {}
-        sheet_width, sheet_height = sheet.get_size()
         
-        # Define sprite mappings
+        # Pick the module-level offset table for this sheet
         if sprite_width == 64:  # Boss sprites
-            mappings = {
-                "bomb_torizo": (0, 0),
-                "spore_spawn": (64, 0),
-                "kraid": (128, 0),
-                "crocomire": (192, 0),
-                "phantoon": (256, 0),
-                "botwoon": (320, 0),
-                "draygon": (384, 0),
-                "gold_torizo": (448, 0),
-                "ridley": (512, 0),
-                "mother_brain_1": (576, 0),
-                "mother_brain_2": (640, 0),
-                "samus_ship": (704, 0),
-                "ceres_station": (768, 0),
-                "golden_four": (832, 0),
-            }
+            mappings = _BOSS_SPRITE_MAPPINGS
         else:  # Item sprites
-            mappings = {
-                "missiles": (0, 16),
-                "supers": (32, 16),
-                "power_bombs": (64, 16),
-                "energy_tank": (64, 0),
-                "morph": (0, 0),
-                "bomb": (32, 0),
-                "hijump": (0, 32),
-                "speed": (32, 32),
-                "grapple": (64, 32),
-                "xray": (96, 32),
-                "spring": (0, 48),
-                "space": (32, 48),
-                "screw": (64, 48),
-                "charge": (96, 48),
-                "spazer": (0, 64),
-                "wave": (32, 64),
-                "ice": (64, 64),
-                "plasma": (96, 64),
-                "varia": (0, 80),
-                "gravity": (32, 80),
-            }
+            mappings = _ITEM_SPRITE_MAPPINGS
             
-        for name, (x, y) in mappings.items():
-            sprite = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
-            sprite.blit(sheet, (0, 0), (x, y, sprite_width, sprite_height))
-            sprites[name] = sprite
+        for name, x, y in mappings:
+            # Zero-copy view into the sheet; nothing mutates the base
+            # sprites, so no per-cell pixel copy is needed
+            sprites[name] = sheet.subsurface((x, y, sprite_width, sprite_height))
             
         return sprites
         
     def load_enemy_sprites(self, sheet: pygame.Surface, sprite_width: int, sprite_height: int) -> Dict[str, pygame.Surface]:
         """Load enemy sprites from a single row sheet"""
         sprites = {}
-        enemy_names = ["geemer", "skree", "side_hopper", "ciser", "metroid"]
-        
-        for i, name in enumerate(enemy_names):
-            x = i * sprite_width
-            y = 0
-            sprite = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
-            sprite.blit(sheet, (0, 0), (x, y, sprite_width, sprite_height))
-            sprites[name] = sprite
+        
+        for i, name in enumerate(_ENEMY_SPRITE_NAMES):
+            sprites[name] = sheet.subsurface((i * sprite_width, 0,
+                                              sprite_width, sprite_height))
             
         return sprites
         
+    def _get(self, kind: str, sprite_id: str, size: int, gray: bool = False):
+        """Fetch any sprite surface at size via the kind/gray table"""
+        sprites, by_size = self._tables[(kind, gray)]
+        return self._get_scaled(sprites, by_size, sprite_id, size)
+
+    def _draw(self, screen: pygame.Surface, kind: str, sprite_id: str,
+              x: int, y: int, size: int, gray: bool = False):
+        """Table-driven draw shared by all the draw_* wrappers"""
+        sprite = self._get(kind, sprite_id, size, gray)
+        if sprite is not None:
+            screen.blit(sprite, (x, y))
+
+    def get_item(self, item_id: str, size: int, gray: bool = False):
+        """Fetch an item sprite surface at size (for batched blits)"""
+        return self._get("item", item_id, size, gray)
+
+    def get_boss(self, boss_id: str, size: int, gray: bool = False):
+        """Fetch a boss sprite surface at size (for batched blits)"""
+        return self._get("boss", boss_id, size, gray)
+
     def draw_boss(self, screen: pygame.Surface, boss_id: str, x: int, y: int, size: int):
         """Draw a boss sprite"""
-        if boss_id in self.boss_sprites:
-            sprite = self.boss_sprites[boss_id]
-            scaled_sprite = pygame.transform.scale(sprite, (size, size))
-            screen.blit(scaled_sprite, (x, y))
+        self._draw(screen, "boss", boss_id, x, y, size)
             
     def draw_item(self, screen: pygame.Surface, item_id: str, x: int, y: int, size: int):
         """Draw an item sprite"""
-        if item_id in self.item_sprites:
-            sprite = self.item_sprites[item_id]
-            scaled_sprite = pygame.transform.scale(sprite, (size, size))
-            screen.blit(scaled_sprite, (x, y))
+        self._draw(screen, "item", item_id, x, y, size)
             
     def draw_item_grayed(self, screen: pygame.Surface, item_id: str, x: int, y: int, size: int):
         """Draw a grayed out item sprite"""
-        if item_id in self.item_sprites:
-            sprite = self.item_sprites[item_id]
-            scaled_sprite = pygame.transform.scale(sprite, (size, size))
-            
-            # Create a grayed out version
-            grayed = scaled_sprite.copy()
-            grayed.fill((128, 128, 128, 128), special_flags=pygame.BLEND_RGBA_MULT)
-            
-            screen.blit(grayed, (x, y))
+        self._draw(screen, "item", item_id, x, y, size, gray=True)
             
     def draw_boss_grayed(self, screen: pygame.Surface, boss_id: str, x: int, y: int, size: int):
         """Draw a grayed out boss sprite"""
-        if boss_id in self.boss_sprites:
-            sprite = self.boss_sprites[boss_id]
-            scaled_sprite = pygame.transform.scale(sprite, (size, size))
-            
-            # Create a grayed out version
-            grayed = scaled_sprite.copy()
-            grayed.fill((128, 128, 128, 128), special_flags=pygame.BLEND_RGBA_MULT)
-            
-            screen.blit(grayed, (x, y))
+        self._draw(screen, "boss", boss_id, x, y, size, gray=True)
             
     def draw_enemy(self, screen: pygame.Surface, enemy_id: str, x: int, y: int, size: int):
         """Draw an enemy sprite (scaled up from 32x32 to match boss size)"""
-        if enemy_id in self.enemy_sprites:
-            sprite = self.enemy_sprites[enemy_id]
-            scaled_sprite = pygame.transform.scale(sprite, (size, size))
-            screen.blit(scaled_sprite, (x, y))
+        self._draw(screen, "enemy", enemy_id, x, y, size)
             
     def draw_enemy_grayed(self, screen: pygame.Surface, enemy_id: str, x: int, y: int, size: int):
         """Draw a grayscaled enemy sprite (scaled up from 32x32)"""
-        if enemy_id in self.enemy_sprites:
-            sprite = self.enemy_sprites[enemy_id]
-            scaled_sprite = pygame.transform.scale(sprite, (size, size))
-            
-            # Create a grayed out version
-            grayed = scaled_sprite.copy()
-            grayed.fill((128, 128, 128, 128), special_flags=pygame.BLEND_RGBA_MULT)
-            
-            screen.blit(grayed, (x, y))
+        self._draw(screen, "enemy", enemy_id, x, y, size, gray=True)
 
 if __name__ == "__main__":
     game = Game()